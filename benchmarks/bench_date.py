@@ -0,0 +1,110 @@
+"""
+Benchmarks of the Date operations
+
+Times construction, parsing, comparisons, every *_between method and every add_/remove_ method
+for spans of 1 day, 1 year, 100 years and 1000 years, and writes the results as JSON.
+
+Usage:
+    python benchmarks/bench_date.py --output results.json
+    python benchmarks/bench_date.py --compare results.json
+"""
+from pathlib import Path
+import argparse, json, platform, subprocess, sys, time, timeit
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from date_operations import Date
+from date_operations.date import parse_date, clear_parse_cache
+
+SPANS = {"1 day": 1, "1 year": 365, "100 years": 36524, "1000 years": 365242}
+START = "15-06-1500"
+BETWEEN = ("days_between", "week_between", "months_between", "years_between", "hours_between", "minutes_between", "second_between")
+
+def _fresh_strings(count):
+    return [f"{day:02d}-{month:02d}-{year:04d}" for year in range(1900, 2100) for month in range(1, 13) for day in (1, 15)][:count]
+
+def benchmarks() -> list:
+    """
+    Builds the list of benchmarks
+    :return: a list of (name, span, function) tuples, span is None when the operation has no span
+    """
+    cases = []
+    strings = _fresh_strings(4096)
+    def construct_uncached():
+        clear_parse_cache()
+        for string in strings: Date(string)
+    cases.append(("construct_cached", None, lambda: Date("24-01-2000")))
+    cases.append(("construct_uncached_x4096", None, construct_uncached))
+    cases.append(("parse_date", None, lambda: parse_date("24-01-2000")))
+    date, other = Date("24-01-2000"), Date("10-09-1953")
+    cases.append(("eq", None, lambda: date == other))
+    cases.append(("lt", None, lambda: date < other))
+    cases.append(("hash", None, lambda: hash(date)))
+    dates = [Date(string) for string in reversed(strings)]
+    cases.append(("sorted_x4096", None, lambda: sorted(dates)))
+    cases.append(("get_weekday", None, date.get_weekday))
+    cases.append(("full_date", None, lambda: date.full_date))
+    for span_name, days in SPANS.items():
+        start = Date(START)
+        end = start.plus_days(days)
+        months, years = max(1, days*12//365), max(1, days//365)
+        for method in BETWEEN:
+            cases.append((method, span_name, lambda method=method, start=start, end=end: getattr(start, method)(end)))
+        for method, amount, origin in (("add_days", days, start), ("remove_days", days, end), ("add_months", months, start),
+                                       ("remove_months", months, end), ("add_years", years, start), ("remove_years", years, end)):
+            cases.append((method, span_name, lambda method=method, amount=amount, origin=origin: getattr(origin.copy(), method)(amount)))
+    return cases
+
+def run(repeat=5, min_time=0.05) -> dict:
+    """
+    Times every benchmark, keeping the best of several repeats
+    :param repeat: the number of timed repeats
+    :param min_time: the minimum duration of one repeat in seconds, used to pick the number of calls
+    :return: the results as a JSON-serializable dictionary
+    """
+    results = []
+    for name, span, function in benchmarks():
+        timer = timeit.Timer(function)
+        number, elapsed = 1, timer.timeit(1)
+        while elapsed < min_time / 10:
+            number *= 10
+            elapsed = timer.timeit(number)
+        number = max(1, int(number * min_time / elapsed))
+        best = min(timer.repeat(repeat=repeat, number=number)) / number
+        results.append({"name": name, "span": span, "ns_per_call": round(best * 1e9, 1), "calls": number})
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                cwd=Path(__file__).resolve().parent).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {"commit": commit, "python": platform.python_version(), "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"), "results": results}
+
+def compare(old, new) -> list:
+    """
+    Compares two runs
+    :return: a list of (name, span, old ns, new ns, ratio) for the benchmarks present in both
+    """
+    previous = {(result["name"], result["span"]): result["ns_per_call"] for result in old["results"]}
+    return [(result["name"], result["span"], previous[(result["name"], result["span"])], result["ns_per_call"],
+             result["ns_per_call"] / previous[(result["name"], result["span"])])
+            for result in new["results"] if (result["name"], result["span"]) in previous]
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the Date operations.")
+    parser.add_argument("--output", help="write the JSON results to this file instead of standard output")
+    parser.add_argument("--compare", help="a previous JSON result to compare against")
+    parser.add_argument("--repeat", type=int, default=5, help="timed repeats per benchmark, the best one is kept")
+    args = parser.parse_args(argv)
+    results = run(args.repeat)
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2))
+    else:
+        print(json.dumps(results, indent=2))
+    if args.compare:
+        for name, span, old, new, ratio in compare(json.loads(Path(args.compare).read_text()), results):
+            print(f"{name:<26} {span or '':<11} {old:>12.1f} -> {new:>12.1f} ns  x{ratio:.2f}", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1 +1,6 @@
-from .date import Date
\ No newline at end of file
+from .date import Date, FrozenDate
+
+try:
+    from .array import DateArray
+except ImportError:
+    pass
\ No newline at end of file
@@ -0,0 +1,427 @@
+"""
+Vectorized date columns
+
+DateArray keeps a column of dates as a NumPy int32 array of ordinals (01-01-0001 is day 1) and offers
+batch versions of the Date methods. Every result matches, element for element, the one of the scalar Date method.
+NumPy is an optional dependency: install it with `pip install date_operations[numpy]`.
+"""
+from date_operations.custom_exceptions import InvalidDateAdd, InvalidDateRemove
+from date_operations.date import Date, WEEKDAYS, MIN_ORDINAL, MAX_ORDINAL, parse_date, to_ordinal
+import datetime
+import numpy as np
+
+_DAYS_BEFORE_MONTH = np.array([0, 0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334], dtype=np.int64)
+_MONTH_DAYS = np.array([0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31], dtype=np.int64)
+_WEEKDAY_NAMES = np.array([""] + [WEEKDAYS[index] for index in range(1, 8)])
+_UNIX_EPOCH = 719163
+_DEFAULT_LAYOUT = (10, ((2, "-"), (5, "-")), {"day": (0, 2), "month": (3, 5), "year": (6, 10)})
+
+def _is_leap(year) -> np.ndarray:
+    return (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+
+def _month_days(year, month) -> np.ndarray:
+    return _MONTH_DAYS[month] + ((month == 2) & _is_leap(year))
+
+def _to_ordinals(year, month, day) -> np.ndarray:
+    """
+    Vectorized version of date.to_ordinal
+    """
+    y = year - 1
+    return y*365 + y//4 - y//100 + y//400 + _DAYS_BEFORE_MONTH[month] + ((month > 2) & _is_leap(year)) + day
+
+def _from_ordinals(ordinals) -> tuple:
+    """
+    Vectorized version of date.from_ordinal, counting from 01-03-0000 so that the leap day ends each cycle
+    :return: a tuple of arrays (year, month, day)
+    """
+    days = np.asarray(ordinals, dtype=np.int64) + 305
+    era = days // 146097
+    day_of_era = days - era*146097
+    year_of_era = (day_of_era - day_of_era//1460 + day_of_era//36524 - day_of_era//146096) // 365
+    day_of_year = day_of_era - (365*year_of_era + year_of_era//4 - year_of_era//100)
+    shifted_month = (5*day_of_year + 2) // 153
+    day = day_of_year - (153*shifted_month + 2)//5 + 1
+    month = np.where(shifted_month < 10, shifted_month + 3, shifted_month - 9)
+    year = year_of_era + era*400 + (month <= 2)
+    return year, month, day
+
+def _round(values, digits=2) -> np.ndarray:
+    """
+    Rounds like the built-in round, which np.round does not do on values close to a tie
+    """
+    values = np.asarray(values, dtype=np.float64)
+    rounded = np.round(values, digits)
+    scaled = values * 10**digits
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    for index in zip(*np.nonzero(near_tie)):
+        rounded[index] = round(float(values[index]), digits)
+    return rounded
+
+def _parse_strings(values, plan=None) -> np.ndarray:
+    """
+    Parses a sequence of date strings in one pass, in dd-mm-yyyy format or in the fixed-width format of a
+    formats.FormatPlan. Rows the fast path cannot accept are handed to date.parse_date (or to the plan),
+    which raises the same error the scalar parser would.
+    :return: the array of ordinals
+    """
+    width, literals, slices = _DEFAULT_LAYOUT if plan is None else plan.layout
+    parse = parse_date if plan is None else plan.parse
+    strings = np.asarray(values, dtype=np.str_).reshape(-1)
+    if len(strings) == 0: return np.zeros(0, dtype=np.int64)
+    itemsize = strings.dtype.itemsize // 4
+    codes = np.zeros((len(strings), max(itemsize, width + 1)), dtype=np.uint32)
+    codes[:, :itemsize] = strings.view(np.uint32).reshape(len(strings), itemsize)
+    valid = codes[:, width] == 0
+    for position, char in literals:
+        valid &= codes[:, position] == ord(char)
+    fields = {}
+    for field, (start, end) in slices.items():
+        digits = codes[:, start:end].astype(np.int64) - 48
+        valid &= np.all((digits >= 0) & (digits <= 9), axis=1)
+        fields[field] = digits @ (10 ** np.arange(end - start - 1, -1, -1))
+    day, month, year = fields["day"], fields["month"], fields["year"]
+    valid &= (year >= 1) & (month >= 1) & (month <= 12)
+    month = np.where(valid, month, 1)
+    valid &= (day >= 1) & (day <= _month_days(year, month))
+    ordinals = _to_ordinals(year, month, day)
+    for index in np.nonzero(~valid)[0]:
+        day, month, year = parse(strings[index].item())
+        ordinals[index] = to_ordinal(year, month, day)
+    return ordinals
+
+def _as_ordinals(other) -> np.ndarray:
+    """
+    Converts the other operand of a batch operation (DateArray, Date, string or sequence of them) to ordinals
+    """
+    if isinstance(other, DateArray): return other.ordinals
+    if isinstance(other, Date): return np.int64(other.ordinal)
+    if type(other) == str: return np.int64(Date(other).ordinal)
+    return DateArray(other).ordinals
+
+def _check_offsets(values, error) -> np.ndarray:
+    """
+    Checks that the numbers of days or months to add or remove are not negative
+    """
+    offsets = np.asarray(values)
+    if offsets.dtype.kind not in "iuf": raise error(values)
+    if np.any(offsets < 0): raise error(offsets[offsets < 0].flat[0])
+    return offsets.astype(np.int64)
+
+def days_between(ordinals, other_ordinals) -> np.ndarray:
+    return np.abs(ordinals - other_ordinals)
+
+def months_between(year, month, day, other_year, other_month, other_day) -> np.ndarray:
+    """
+    Vectorized version of date.months_between, inputs are broadcast together
+    """
+    self_bigger = (year > other_year) | ((year == other_year) & ((month > other_month) | ((month == other_month) & (day > other_day))))
+    big_year, big_month, big_day = np.where(self_bigger, year, other_year), np.where(self_bigger, month, other_month), np.where(self_bigger, day, other_day)
+    small_year, small_month, small_day = np.where(self_bigger, other_year, year), np.where(self_bigger, other_month, month), np.where(self_bigger, other_day, day)
+    months = (big_year - small_year)*12
+    days_month_smaller = small_day / _month_days(small_year, small_month)
+    days_month_bigger = big_day / _month_days(big_year, big_month)
+    months = np.where(big_month >= small_month,
+                      months + (big_month - small_month - days_month_smaller + days_month_bigger),
+                      months - (small_month - big_month + days_month_smaller - days_month_bigger))
+    months = _round(months)
+    months = np.where((year == other_year) & (day == other_day), np.abs(month - other_month), months)
+    return np.where((year == other_year) & (month == other_month), 0, months).astype(np.float64)
+
+def years_between(year, month, day, other_year, other_month, other_day) -> np.ndarray:
+    """
+    Vectorized version of date.years_between, inputs are broadcast together
+    """
+    self_bigger = (year > other_year) | ((year == other_year) & ((month > other_month) | ((month == other_month) & (day > other_day))))
+    big_year, big_month, big_day = np.where(self_bigger, year, other_year), np.where(self_bigger, month, other_month), np.where(self_bigger, day, other_day)
+    small_year, small_month, small_day = np.where(self_bigger, other_year, year), np.where(self_bigger, other_month, month), np.where(self_bigger, other_day, day)
+    smaller_day_to_year = (small_day / _month_days(small_year, small_month))/12
+    bigger_day_to_year = (big_day / _month_days(big_year, big_month))/12
+    year_difference = big_year - small_year
+    year_difference = np.where(big_month >= small_month,
+                               year_difference + ((big_month - small_month)/12 - smaller_day_to_year + bigger_day_to_year),
+                               year_difference - ((small_month - big_month)/12 + smaller_day_to_year - bigger_day_to_year))
+    year_difference = _round(year_difference)
+    same_day = (month == other_month) & (day == other_day)
+    return np.where(same_day, np.abs(year - other_year), year_difference).astype(np.float64)
+
+class DateArray:
+    def __init__(self, dates):
+        """
+           Initializes the DateArray instance.
+           Args:
+               dates: a sequence of strings in dd-mm-yyyy format or of Date objects, or another DateArray.
+           Raises:
+               InvalidDateFormatError, InvalidDateError: for the first string that is not a valid date.
+        """
+        if isinstance(dates, DateArray):
+            ordinals = dates.ordinals
+        else:
+            dates = list(dates)
+            if dates and all(isinstance(date, Date) for date in dates):
+                ordinals = np.array([date.ordinal for date in dates], dtype=np.int64)
+            else:
+                ordinals = _parse_strings([str(date) if isinstance(date, Date) else date for date in dates])
+        self.__ordinals = ordinals.astype(np.int32)
+
+    @classmethod
+    def from_ordinals(cls, ordinals):
+        """
+        Builds a DateArray from an array of ordinals
+        :param ordinals: integers between MIN_ORDINAL and MAX_ORDINAL
+        :return: a new DateArray object
+        """
+        ordinals = np.asarray(ordinals).reshape(-1)
+        if ordinals.dtype.kind not in "iu": raise TypeError(f"Ordinals must be integers, not {ordinals.dtype}.")
+        if len(ordinals) and (ordinals.min() < MIN_ORDINAL or ordinals.max() > MAX_ORDINAL):
+            raise ValueError(f"Ordinals must be between {MIN_ORDINAL} and {MAX_ORDINAL}.")
+        array = cls.__new__(cls)
+        array.__ordinals = ordinals.astype(np.int32)
+        return array
+
+    @classmethod
+    def from_datetime64(cls, values):
+        """
+        Builds a DateArray from NumPy datetimes, without going through strings; the time of day is dropped
+        :param values: an array of datetime64 of any unit
+        :return: a new DateArray object
+        """
+        values = np.asarray(values)
+        if values.dtype.kind != "M": raise TypeError(f"Values must be datetime64, not {values.dtype}.")
+        days = values.astype("datetime64[D]")
+        if np.any(np.isnat(days)): raise ValueError("Values must not contain NaT.")
+        return cls.from_ordinals(days.astype(np.int64) + _UNIX_EPOCH)
+
+    def to_datetime64(self) -> np.ndarray:
+        """
+        Converts the dates to NumPy datetimes
+        :return: an array of datetime64[D]
+        """
+        return (self.ordinals - _UNIX_EPOCH).astype("datetime64[D]")
+
+    @classmethod
+    def from_pydates(cls, dates):
+        """
+        Builds a DateArray from a sequence of datetime.date, without going through strings
+        :param dates: a sequence of datetime.date
+        :return: a new DateArray object
+        """
+        return cls.from_ordinals(np.fromiter((date.toordinal() for date in dates), dtype=np.int64))
+
+    def to_pydates(self) -> list:
+        """
+        Converts the dates to the standard library type
+        :return: a list of datetime.date
+        """
+        return [datetime.date.fromordinal(ordinal) for ordinal in self.ordinals.tolist()]
+
+    @property
+    def ordinals(self) -> np.ndarray:
+        """
+        Given the dates
+        :return: an int64 array of their ordinals
+        """
+        return self.__ordinals.astype(np.int64)
+
+    @property
+    def day(self) -> np.ndarray:
+        """
+        Given the dates
+        :return: an array of days in number format
+        """
+        return _from_ordinals(self.__ordinals)[2]
+
+    @property
+    def month(self) -> np.ndarray:
+        """
+        Given the dates
+        :return: an array of months in number format
+        """
+        return _from_ordinals(self.__ordinals)[1]
+
+    @property
+    def year(self) -> np.ndarray:
+        """
+        Given the dates
+        :return: an array of years in number format
+        """
+        return _from_ordinals(self.__ordinals)[0]
+
+    @property
+    def is_leap(self) -> np.ndarray:
+        """
+        Checks for every date if its year is a leap year.
+        :return: a boolean array
+        """
+        return _is_leap(self.year)
+
+    @property
+    def century(self) -> np.ndarray:
+        """
+        Returns the century in which every year is located
+        :return: an array of centuries
+        """
+        return (self.year - 1)//100 + 1
+
+    def get_weekday(self) -> np.ndarray:
+        """
+        Returns the name of the weekday for every date.
+        :return: an array of strings (e.g., 'Monday', 'Tuesday').
+        """
+        return _WEEKDAY_NAMES[self.get_weekday_index()]
+
+    def get_weekday_index(self) -> np.ndarray:
+        """
+        Returns the number of the weekday for every date, as used in WEEKDAYS.
+        :return: an array of integers from 1 (Monday) to 7 (Sunday).
+        """
+        return (self.ordinals - 1) % 7 + 1
+
+    def second_between(self, other) -> np.ndarray:
+        """
+        Batch version of Date.second_between
+        :param other: a DateArray, a Date, a string or a sequence of dates of the same length
+        :return: an array of differences in seconds
+        """
+        return self.days_between(other) * 24 * 60 * 60
+
+    def minutes_between(self, other) -> np.ndarray:
+        """
+        Batch version of Date.minutes_between
+        :param other: a DateArray, a Date, a string or a sequence of dates of the same length
+        :return: an array of differences in minutes
+        """
+        return self.days_between(other) * 24 * 60
+
+    def hours_between(self, other) -> np.ndarray:
+        """
+        Batch version of Date.hours_between
+        :param other: a DateArray, a Date, a string or a sequence of dates of the same length
+        :return: an array of differences in hours
+        """
+        return self.days_between(other) * 24
+
+    def days_between(self, other) -> np.ndarray:
+        """
+        Batch version of Date.days_between
+        :param other: a DateArray, a Date, a string or a sequence of dates of the same length
+        :return: an array of differences in days
+        """
+        return days_between(self.ordinals, _as_ordinals(other))
+
+    def week_between(self, other) -> np.ndarray:
+        """
+        Batch version of Date.week_between
+        :param other: a DateArray, a Date, a string or a sequence of dates of the same length
+        :return: an array of differences in weeks
+        """
+        return _round(self.days_between(other)/7)
+
+    def months_between(self, other) -> np.ndarray:
+        """
+        Batch version of Date.months_between
+        :param other: a DateArray, a Date, a string or a sequence of dates of the same length
+        :return: an array of differences in months
+        """
+        return months_between(*_from_ordinals(self.__ordinals), *_from_ordinals(_as_ordinals(other)))
+
+    def years_between(self, other) -> np.ndarray:
+        """
+        Batch version of Date.years_between
+        :param other: a DateArray, a Date, a string or a sequence of dates of the same length
+        :return: an array of differences in years
+        """
+        return years_between(*_from_ordinals(self.__ordinals), *_from_ordinals(_as_ordinals(other)))
+
+    def add_days(self, days):
+        """
+        Batch version of Date.add_days
+        :param days: the number of days to add, or an array with one number per date
+        :return: a new DateArray, the original one is not modified
+        """
+        ordinals = self.ordinals + _check_offsets(days, InvalidDateAdd)
+        if len(ordinals) and ordinals.max() > MAX_ORDINAL: raise InvalidDateAdd(days)
+        return DateArray.from_ordinals(ordinals)
+
+    def remove_days(self, days):
+        """
+        Batch version of Date.remove_days
+        :param days: the number of days to remove, or an array with one number per date
+        :return: a new DateArray, the original one is not modified
+        """
+        ordinals = self.ordinals - _check_offsets(days, InvalidDateRemove)
+        if len(ordinals) and ordinals.min() < MIN_ORDINAL: raise InvalidDateRemove(days)
+        return DateArray.from_ordinals(ordinals)
+
+    def add_months(self, months):
+        """
+        Batch version of Date.add_months, days are clamped to the end of the new month
+        :param months: the number of months to add, or an array with one number per date
+        :return: a new DateArray, the original one is not modified
+        """
+        return self.__shift_months(_check_offsets(months, InvalidDateAdd), months)
+
+    def remove_months(self, months):
+        """
+        Batch version of Date.remove_months, days are clamped to the end of the new month
+        :param months: the number of months to remove, or an array with one number per date
+        :return: a new DateArray, the original one is not modified
+        """
+        return self.__shift_months(-_check_offsets(months, InvalidDateRemove), months)
+
+    def __shift_months(self, offsets, months):
+        """
+        Private method that moves every date by a signed number of months
+        """
+        year, month, day = _from_ordinals(self.__ordinals)
+        year, month = np.divmod(year*12 + month - 1 + offsets, 12)
+        if len(year) and year.max() > 9999: raise InvalidDateAdd(months)
+        if len(year) and year.min() < 1: raise InvalidDateRemove(months)
+        return DateArray.from_ordinals(_to_ordinals(year, month + 1, np.minimum(day, _month_days(year, month + 1))))
+
+    def tolist(self) -> list:
+        """
+        Converts the dates to Date objects
+        :return: a list of Date objects
+        """
+        return [self[index] for index in range(len(self))]
+
+    def __len__(self) -> int:
+        return len(self.__ordinals)
+
+    def __getitem__(self, index):
+        """
+        Returns a Date for an integer index, a new DateArray for a slice, a mask or an array of indices
+        """
+        if isinstance(index, (int, np.integer)):
+            ordinal = int(self.__ordinals[index])
+            year, month, day = (int(field) for field in _from_ordinals(ordinal))
+            return Date._from_fields(year, month, day, ordinal)
+        return DateArray.from_ordinals(self.__ordinals[index])
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def __eq__(self, other) -> np.ndarray:
+        return self.ordinals == _as_ordinals(other)
+
+    def __ne__(self, other) -> np.ndarray:
+        return self.ordinals != _as_ordinals(other)
+
+    def __gt__(self, other) -> np.ndarray:
+        return self.ordinals > _as_ordinals(other)
+
+    def __lt__(self, other) -> np.ndarray:
+        return self.ordinals < _as_ordinals(other)
+
+    def __ge__(self, other) -> np.ndarray:
+        return self.ordinals >= _as_ordinals(other)
+
+    def __le__(self, other) -> np.ndarray:
+        return self.ordinals <= _as_ordinals(other)
+
+    def __str__(self) -> str:
+        return "[" + ", ".join(str(date) for date in self) + "]"
+
+    def __repr__(self) -> str:
+        return f"DateArray({[str(date) for date in self]})"
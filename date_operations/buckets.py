@@ -0,0 +1,114 @@
+"""
+Temporal bucketing
+
+Maps dates to integer bucket ids of a unit: "month", "quarter", "year", "century" or "iso_week".
+Ids are computed from the numeric fields of a date, so they sort like the buckets they name:
+    month     year*12 + month - 1           quarter  year*4 + (month - 1)//3
+    year      year                          century  (year - 1)//100 + 1, as Date.century
+    iso_week  (ordinal - 1)//7, the number of whole weeks since Monday 01-01-0001
+bucket_ids computes the ids of a whole column at once and group_by aggregates a stream of records
+in a single pass, reading the fields of date strings without building Date objects.
+"""
+from date_operations.date import Date, fields_of, from_month_to_days, from_ordinal, to_ordinal
+
+UNITS = ("month", "quarter", "year", "century", "iso_week")
+AGGREGATES = ("count", "sum")
+
+def _check_unit(unit) -> None:
+    if unit not in UNITS: raise ValueError(f"Invalid unit: '{unit}'. Use one of {UNITS}.")
+
+def bucket_id(year, month, day, unit) -> int:
+    """
+    Calculates the bucket of a date given by its numeric fields
+    :param unit: one of UNITS
+    :return: the bucket id
+    """
+    if unit == "month": return year*12 + month - 1
+    if unit == "quarter": return year*4 + (month - 1)//3
+    if unit == "year": return year
+    if unit == "century": return (year - 1)//100 + 1
+    _check_unit(unit)
+    return (to_ordinal(year, month, day) - 1)//7
+
+def bucket_of(date, unit: str) -> int:
+    """
+    Calculates the bucket of one date
+    :param date: a Date or a string in dd-mm-yyyy format
+    :param unit: one of UNITS
+    :return: the bucket id
+    """
+    _check_unit(unit)
+    return bucket_id(*fields_of(date), unit)
+
+def bucket_bounds(bucket: int, unit: str) -> tuple:
+    """
+    Returns the first and the last day of a bucket, month ends follow from_month_to_days
+    :param bucket: a bucket id of the unit
+    :param unit: one of UNITS
+    :return: a tuple of two Date objects
+    """
+    _check_unit(unit)
+    if unit == "iso_week":
+        first = bucket*7 + 1
+        return Date.from_ordinal(first), Date.from_ordinal(first + 6)
+    if unit == "month":
+        year, month = divmod(bucket, 12)
+        first, last = (year, month + 1), (year, month + 1)
+    elif unit == "quarter":
+        year, quarter = divmod(bucket, 4)
+        first, last = (year, quarter*3 + 1), (year, quarter*3 + 3)
+    elif unit == "year":
+        first, last = (bucket, 1), (bucket, 12)
+    else:
+        first, last = ((bucket - 1)*100 + 1, 1), (bucket*100, 12)
+    return Date._from_fields(*first, 1), Date._from_fields(*last, from_month_to_days(*last))
+
+def bucket_label(bucket: int, unit: str):
+    """
+    Describes a bucket with calendar numbers
+    :param bucket: a bucket id of the unit
+    :param unit: one of UNITS
+    :return: (year, month) for months, (year, quarter) for quarters, (iso year, iso week) for weeks,
+             the year or the century otherwise
+    """
+    _check_unit(unit)
+    if unit == "month": return bucket//12, bucket % 12 + 1
+    if unit == "quarter": return bucket//4, bucket % 4 + 1
+    if unit != "iso_week": return bucket
+    thursday = bucket*7 + 4
+    year = from_ordinal(thursday)[0]
+    return year, (thursday - to_ordinal(year, 1, 1))//7 + 1
+
+def bucket_ids(dates, unit: str):
+    """
+    Calculates the buckets of a whole column of dates in one vectorized pass, requires NumPy
+    :param dates: a DateArray or a sequence of dates
+    :param unit: one of UNITS
+    :return: an int64 array of bucket ids
+    """
+    from date_operations.array import DateArray, _from_ordinals
+    _check_unit(unit)
+    ordinals = (dates if isinstance(dates, DateArray) else DateArray(dates)).ordinals
+    if unit == "iso_week": return (ordinals - 1)//7
+    year, month, _ = _from_ordinals(ordinals)
+    if unit == "month": return year*12 + month - 1
+    if unit == "quarter": return year*4 + (month - 1)//3
+    if unit == "year": return year
+    return (year - 1)//100 + 1
+
+def group_by(records, unit: str, aggregate: str = "count") -> dict:
+    """
+    Aggregates a stream of records per bucket in a single pass, without building Date objects
+    :param records: an iterable of (date, value) pairs, the date is a Date or a string in dd-mm-yyyy format
+    :param unit: one of UNITS
+    :param aggregate: "count" to count the records, "sum" to add up their values
+    :return: a dict from bucket id to aggregate, sorted by bucket
+    """
+    _check_unit(unit)
+    if aggregate not in AGGREGATES: raise ValueError(f"Invalid aggregate: '{aggregate}'. Use one of {AGGREGATES}.")
+    totals = {}
+    count = aggregate == "count"
+    for date, value in records:
+        bucket = bucket_id(*fields_of(date), unit)
+        totals[bucket] = totals.get(bucket, 0) + (1 if count else value)
+    return dict(sorted(totals.items()))
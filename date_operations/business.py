@@ -0,0 +1,176 @@
+"""
+Business-day calendar
+
+BusinessCalendar counts and shifts working days for a configurable weekend and set of holidays.
+The number of working days before any date is computed in closed form from whole weeks, minus a binary search
+in the sorted holiday ordinals, so counting takes O(log h) and shifting O(log n) instead of walking day by day.
+"""
+from date_operations.custom_exceptions import InvalidDateAdd, InvalidDateRemove
+from date_operations.date import Date, WEEKDAYS, MIN_ORDINAL, MAX_ORDINAL, from_ordinal
+from array import array
+from bisect import bisect_left
+
+def _as_date(date):
+    return date if isinstance(date, Date) else Date(date)
+
+class BusinessCalendar:
+    def __init__(self, weekend=(6, 7), holidays=()):
+        """
+           Initializes the BusinessCalendar instance.
+           Args:
+               weekend: the weekdays that are not worked, as keys of WEEKDAYS (1 is Monday, 7 is Sunday).
+               holidays: an iterable of Date objects or dd-mm-yyyy strings that are not worked.
+           Raises:
+               ValueError: If a weekday is unknown or every day of the week is weekend.
+        """
+        weekend = set(weekend)
+        if not weekend <= set(WEEKDAYS): raise ValueError(f"Invalid weekend: '{sorted(weekend)}'. Use keys of WEEKDAYS.")
+        if len(weekend) == 7: raise ValueError("Invalid weekend: at least one weekday must be worked.")
+        self.__working = tuple(index + 1 not in weekend for index in range(7))
+        self.__before_weekday = [sum(self.__working[:index]) for index in range(8)]
+        ordinals = {_as_date(date).ordinal for date in holidays}
+        self.__holidays = array("i", sorted(ordinal for ordinal in ordinals if self.__working[(ordinal - 1) % 7]))
+
+    @property
+    def weekend(self) -> tuple:
+        """
+        Given a calendar
+        :return: the weekdays that are not worked, as keys of WEEKDAYS
+        """
+        return tuple(index + 1 for index in range(7) if not self.__working[index])
+
+    @property
+    def holidays(self) -> list:
+        """
+        Given a calendar
+        :return: the sorted holidays that fall on a working weekday, as Date objects
+        """
+        return [Date._from_fields(*from_ordinal(ordinal), ordinal) for ordinal in self.__holidays]
+
+    def _count_before(self, ordinal) -> int:
+        """
+        Number of working days from 01-01-0001 up to the ordinal excluded
+        """
+        weeks, weekday = divmod(ordinal - 1, 7)
+        return weeks*self.__before_weekday[7] + self.__before_weekday[weekday] - bisect_left(self.__holidays, ordinal)
+
+    def _nth(self, count) -> int:
+        """
+        Ordinal of the working day preceded by exactly count working days, found by binary search
+        """
+        low, high = MIN_ORDINAL, MAX_ORDINAL + 1
+        while low < high:
+            middle = (low + high) // 2
+            if self._count_before(middle + 1) > count:
+                high = middle
+            else:
+                low = middle + 1
+        return low
+
+    def is_business_day(self, date) -> bool:
+        """
+        Checks if a date is worked.
+        :param date: a Date or a string in dd-mm-yyyy format
+        :return: True if the date is neither weekend nor a holiday, False otherwise.
+        """
+        ordinal = _as_date(date).ordinal
+        if not self.__working[(ordinal - 1) % 7]: return False
+        index = bisect_left(self.__holidays, ordinal)
+        return index == len(self.__holidays) or self.__holidays[index] != ordinal
+
+    def business_days_between(self, date, other) -> int:
+        """
+        Method to calculate the working days between two dates
+        :param date: a Date or a string in dd-mm-yyyy format
+        :param other: is a different date to compare
+        :return: the number of working days from the earlier date included to the later one excluded
+        """
+        return abs(self._count_before(_as_date(date).ordinal) - self._count_before(_as_date(other).ordinal))
+
+    def add_business_days(self, date, days: int):
+        """
+        Adds the specified number of working days to a date. A date that is not worked first moves to the next working day.
+        :param date: a Date or a string in dd-mm-yyyy format
+        :param days: The number of working days to add to the date.
+        :return: a new Date object, the original date is not modified
+        """
+        if type(days) == str or days < 0: raise InvalidDateAdd(days)
+        ordinal = self._nth(self._count_before(_as_date(date).ordinal) + int(days))
+        if ordinal > MAX_ORDINAL: raise InvalidDateAdd(days)
+        return Date._from_fields(*from_ordinal(ordinal), ordinal)
+
+    def remove_business_days(self, date, days: int):
+        """
+        Removes the specified number of working days to a date. A date that is not worked first moves to the previous working day.
+        :param date: a Date or a string in dd-mm-yyyy format
+        :param days: The number of working days to remove to the date.
+        :return: a new Date object, the original date is not modified
+        """
+        if type(days) == str or days < 0: raise InvalidDateRemove(days)
+        ordinal = _as_date(date).ordinal
+        count = self._count_before(ordinal + 1) - 1 - int(days)
+        if count < 0: raise InvalidDateRemove(days)
+        ordinal = self._nth(count)
+        return Date._from_fields(*from_ordinal(ordinal), ordinal)
+
+    def business_days_between_many(self, dates, others):
+        """
+        Batch version of business_days_between, requires NumPy
+        :param dates: a DateArray or a sequence of dates
+        :param others: a DateArray, a Date, a string or a sequence of dates of the same length
+        :return: an array of numbers of working days
+        """
+        from date_operations.array import DateArray, _as_ordinals
+        dates = dates if isinstance(dates, DateArray) else DateArray(dates)
+        return abs(self.__count_before_many(dates.ordinals) - self.__count_before_many(_as_ordinals(others)))
+
+    def add_business_days_many(self, dates, days):
+        """
+        Batch version of add_business_days, requires NumPy
+        :param dates: a DateArray or a sequence of dates
+        :param days: the number of working days to add, or an array with one number per date
+        :return: a new DateArray
+        """
+        from date_operations.array import DateArray, _check_offsets
+        dates = dates if isinstance(dates, DateArray) else DateArray(dates)
+        ordinals = self.__nth_many(self.__count_before_many(dates.ordinals) + _check_offsets(days, InvalidDateAdd))
+        if len(ordinals) and ordinals.max() > MAX_ORDINAL: raise InvalidDateAdd(days)
+        return DateArray.from_ordinals(ordinals)
+
+    def remove_business_days_many(self, dates, days):
+        """
+        Batch version of remove_business_days, requires NumPy
+        :param dates: a DateArray or a sequence of dates
+        :param days: the number of working days to remove, or an array with one number per date
+        :return: a new DateArray
+        """
+        from date_operations.array import DateArray, _check_offsets
+        dates = dates if isinstance(dates, DateArray) else DateArray(dates)
+        counts = self.__count_before_many(dates.ordinals + 1) - 1 - _check_offsets(days, InvalidDateRemove)
+        if len(counts) and counts.min() < 0: raise InvalidDateRemove(days)
+        return DateArray.from_ordinals(self.__nth_many(counts))
+
+    def __count_before_many(self, ordinals):
+        """
+        Private vectorized version of _count_before
+        """
+        import numpy as np
+        weeks, weekday = np.divmod(ordinals - 1, 7)
+        before_weekday = np.array(self.__before_weekday, dtype=np.int64)
+        holidays = np.frombuffer(self.__holidays, dtype=np.int32) if self.__holidays else np.zeros(0, dtype=np.int32)
+        return weeks*before_weekday[7] + before_weekday[weekday] - np.searchsorted(holidays, ordinals, side="left")
+
+    def __nth_many(self, counts):
+        """
+        Private vectorized version of _nth, one binary search step for all the counts at a time
+        """
+        import numpy as np
+        low = np.full(np.shape(counts), MIN_ORDINAL, dtype=np.int64)
+        high = np.full(np.shape(counts), MAX_ORDINAL + 1, dtype=np.int64)
+        while np.any(low < high):
+            middle = (low + high) // 2
+            above = self.__count_before_many(middle + 1) > counts
+            active = low < high
+            high = np.where(active & above, middle, high)
+            low = np.where(active & ~above, middle + 1, low)
+        return low
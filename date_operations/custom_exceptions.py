@@ -1,6 +1,6 @@
 class InvalidDateFormatError(Exception):
-    def __init__(self, date):
-        super().__init__(f"Invalid date format: '{date}'. Use the format: 'dd-mm-yyyy'.")
+    def __init__(self, date, date_format="dd-mm-yyyy"):
+        super().__init__(f"Invalid date format: '{date}'. Use the format: '{date_format}'.")
 
 class InvalidDateError(Exception):
     def __init__(self, date):
@@ -13,3 +13,7 @@ class InvalidDateAdd(Exception):
 class InvalidDateRemove(Exception):
     def __init__(self, date):
         super().__init__(f"Invalid date: '{date}'. Cannot add negative numbers, strings or years larger than the date.")
+
+class FrozenDateError(Exception):
+    def __init__(self, date):
+        super().__init__(f"Invalid operation: '{date}' is frozen. Use the plus_ and minus_ methods to get a new date.")
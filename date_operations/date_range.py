@@ -0,0 +1,181 @@
+"""
+Lazy ranges of dates
+
+DateRange behaves like the built-in range: it goes from a start date up to an end date excluded, with a step
+in days, weeks or months, and computes each date only when it is requested. Length, indexing, slicing,
+reversing and membership tests take constant time whatever the span of the range.
+"""
+from date_operations.custom_exceptions import InvalidDateError, InvalidDateFormatError
+from date_operations.date import Date, from_month_to_days, from_ordinal, to_ordinal
+from array import array
+
+UNITS = ("days", "weeks", "months")
+
+def _as_date(date):
+    return date if isinstance(date, Date) else Date(date)
+
+class DateRange:
+    def __init__(self, start, end, step: int = 1, unit: str = "days"):
+        """
+           Initializes the DateRange instance.
+           Args:
+               start (Date or str): the first date of the range.
+               end (Date or str): the date where the range stops, excluded.
+               step (int): the distance between two dates, negative to go backwards.
+               unit (str): "days", "weeks" or "months"; with months the day is clamped to the end of each month.
+           Raises:
+               ValueError: If the step is zero or the unit is unknown.
+        """
+        if unit not in UNITS: raise ValueError(f"Invalid unit: '{unit}'. Use one of {UNITS}.")
+        if type(step) != int or step == 0: raise ValueError(f"Invalid step: '{step}'. Use a non-zero integer.")
+        start, end = _as_date(start), _as_date(end)
+        self.__day, self.__unit = start.day, unit
+        self.__step = step*7 if unit == "weeks" else step
+        self.__first = start.year*12 + start.month - 1 if unit == "months" else start.ordinal
+        self.__indices = range(self.__count(end.ordinal))
+
+    def __count(self, end) -> int:
+        """
+        Private method returning the number of dates before the end ordinal, in the direction of the step
+        """
+        if self.__unit != "months":
+            return max(0, -((self.__ordinal_at(0) - end) // self.__step))
+        year, month, _ = from_ordinal(end)
+        count = max(0, -((self.__first - (year*12 + month - 1)) // self.__step))
+        before = (lambda ordinal: ordinal < end) if self.__step > 0 else (lambda ordinal: ordinal > end)
+        while count > 0 and not before(self.__ordinal_at(count - 1)):
+            count -= 1
+        while before(self.__ordinal_at(count)):
+            count += 1
+        return count
+
+    def __fields_at(self, position) -> tuple:
+        """
+        Private method returning the (year, month, day) of the date at a position of the unsliced range
+        """
+        if self.__unit != "months":
+            return from_ordinal(self.__first + position*self.__step)
+        year, month = divmod(self.__first + position*self.__step, 12)
+        return year, month + 1, min(self.__day, from_month_to_days(year, month + 1))
+
+    def __ordinal_at(self, position) -> int:
+        """
+        Private method returning the ordinal of the date at a position of the unsliced range
+        """
+        if self.__unit != "months":
+            return self.__first + position*self.__step
+        return to_ordinal(*self.__fields_at(position))
+
+    def __position_of(self, date):
+        """
+        Private method returning the position of a date in the unsliced range, None if the date is not on a step
+        """
+        if self.__unit != "months":
+            distance = date.ordinal - self.__first
+        else:
+            distance = date.year*12 + date.month - 1 - self.__first
+        if distance % self.__step != 0: return None
+        position = distance // self.__step
+        if self.__unit == "months" and date.day != min(self.__day, from_month_to_days(date.year, date.month)):
+            return None
+        return position
+
+    def __date_at(self, position):
+        year, month, day = self.__fields_at(position)
+        return Date._from_fields(year, month, day)
+
+    @property
+    def unit(self) -> str:
+        """
+        Given a range
+        :return: the unit of the step, "weeks" ranges are reported in "days"
+        """
+        return "months" if self.__unit == "months" else "days"
+
+    @property
+    def step(self) -> int:
+        """
+        Given a range
+        :return: the distance between two consecutive dates, in unit
+        """
+        return self.__step * self.__indices.step
+
+    def index(self, date) -> int:
+        """
+        Returns the position of a date in the range.
+        :param date: a Date or a string in dd-mm-yyyy format
+        :return: the index of the date
+        Raises:
+            ValueError: If the date is not in the range.
+        """
+        position = self.__position_of(_as_date(date))
+        if position is None or position not in self.__indices: raise ValueError(f"'{date}' is not in range")
+        return self.__indices.index(position)
+
+    def count(self, date) -> int:
+        """
+        Counts how many times a date is in the range.
+        :param date: a Date or a string in dd-mm-yyyy format
+        :return: 1 if the date is in the range, 0 otherwise
+        """
+        return 1 if date in self else 0
+
+    def ordinals(self) -> array:
+        """
+        Computes the ordinals of all the dates of the range
+        :return: an array('i') of ordinals
+        """
+        return array("i", (self.__ordinal_at(position) for position in self.__indices))
+
+    def to_array(self):
+        """
+        Computes all the dates of the range at once, requires NumPy
+        :return: a DateArray
+        """
+        import numpy as np
+        from date_operations.array import DateArray, _month_days, _to_ordinals
+        positions = np.arange(self.__indices.start, self.__indices.stop, self.__indices.step, dtype=np.int64)
+        if self.__unit != "months":
+            return DateArray.from_ordinals(self.__first + positions*self.__step)
+        year, month = np.divmod(self.__first + positions*self.__step, 12)
+        return DateArray.from_ordinals(_to_ordinals(year, month + 1, np.minimum(self.__day, _month_days(year, month + 1))))
+
+    def __len__(self) -> int:
+        return len(self.__indices)
+
+    def __getitem__(self, index):
+        """
+        Returns a Date for an integer index, a new DateRange for a slice
+        """
+        if isinstance(index, slice):
+            date_range = DateRange.__new__(DateRange)
+            date_range.__day, date_range.__unit, date_range.__step, date_range.__first = self.__day, self.__unit, self.__step, self.__first
+            date_range.__indices = self.__indices[index]
+            return date_range
+        return self.__date_at(self.__indices[index])
+
+    def __iter__(self):
+        for position in self.__indices:
+            yield self.__date_at(position)
+
+    def __reversed__(self):
+        for position in reversed(self.__indices):
+            yield self.__date_at(position)
+
+    def __contains__(self, date) -> bool:
+        """
+        Checks if a date is in the range in constant time.
+        :param date: a Date or a string in dd-mm-yyyy format
+        :return: True if the date is in the range, False otherwise
+        """
+        if not isinstance(date, (Date, str)): return False
+        try:
+            date = _as_date(date)
+        except (InvalidDateFormatError, InvalidDateError):
+            return False
+        position = self.__position_of(date)
+        return position is not None and position in self.__indices
+
+    def __repr__(self) -> str:
+        if not self.__indices: return "DateRange([])"
+        return f"DateRange({self[0]}, {self[-1]}, step={self.step}, unit='{self.unit}', len={len(self)})"
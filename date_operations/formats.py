@@ -0,0 +1,235 @@
+"""
+Parsing and formatting dates in other formats
+
+A format is a string with strftime-like directives, or the name of one of the PRESETS:
+    %d  day, two digits            %-d  day, one or two digits
+    %m  month, two digits          %-m  month, one or two digits
+    %Y  year, four digits          %B   month name from CALENDAR, e.g. January
+    %b  first three letters of the month name, e.g. Jan
+    %A  weekday name from WEEKDAYS, e.g. Monday
+    %%  a literal %
+Each format is compiled once into a FormatPlan and cached. Formats made only of %d, %m, %Y and fixed characters
+are parsed by slicing at known positions, without regular expressions. parse_many reads the other formats by
+splitting the whole column on the separators between directives, as long as every two directives are separated
+by characters that are neither letters nor digits; only formats like "%-d%B" go through the regex row by row.
+"""
+from date_operations.custom_exceptions import InvalidDateError, InvalidDateFormatError
+from date_operations.date import CALENDAR, WEEKDAYS, from_month_to_days, to_ordinal
+from functools import lru_cache
+import re
+
+PRESETS = {"italian": "%d-%m-%Y", "iso": "%Y-%m-%d", "slashed": "%d/%m/%Y", "us": "%m/%d/%Y", "dotted": "%d.%m.%Y",
+           "compact": "%Y%m%d", "long": "%-d %B %Y", "full": "%A %-d %B %Y"}
+DIRECTIVES = ("%d", "%-d", "%m", "%-m", "%Y", "%B", "%b", "%A")
+_PATTERNS = {"%d": r"(\d{2})", "%-d": r"(\d{1,2})", "%m": r"(\d{2})", "%-m": r"(\d{1,2})", "%Y": r"(\d{4})",
+             "%B": r"([A-Za-z]+)", "%b": r"([A-Za-z]{3})", "%A": r"([A-Za-z]+)"}
+_WIDTHS = {"%d": 2, "%m": 2, "%Y": 4}
+_FIELDS = {"%d": "day", "%-d": "day", "%m": "month", "%-m": "month", "%B": "month", "%b": "month", "%Y": "year"}
+_MONTH_NAMES = {name.casefold(): month for month, name in CALENDAR.items()}
+_MONTH_ABBREVIATIONS = {name[:3].casefold(): month for month, name in CALENDAR.items()}
+_WEEKDAY_NAMES = {name.casefold(): index for index, name in WEEKDAYS.items()}
+_NAMES = {"%B": _MONTH_NAMES, "%b": _MONTH_ABBREVIATIONS, "%A": _WEEKDAY_NAMES}
+_LENGTHS = {"%d": (2, 2), "%-d": (1, 2), "%m": (2, 2), "%-m": (1, 2), "%Y": (4, 4)}
+
+def _tokenize(fmt) -> list:
+    """
+    Splits a format into directives and literal strings
+    """
+    tokens, index = [], 0
+    while index < len(fmt):
+        if fmt[index] != "%":
+            tokens.append(fmt[index])
+            index += 1
+            continue
+        directive = fmt[index:index + 3] if fmt[index + 1:index + 2] == "-" else fmt[index:index + 2]
+        if directive == "%%":
+            tokens.append("%")
+        elif directive not in DIRECTIVES:
+            raise ValueError(f"Invalid format: '{fmt}'. Unknown directive '{directive}'.")
+        else:
+            tokens.append(directive)
+        index += len(directive)
+    return tokens
+
+class FormatPlan:
+    def __init__(self, fmt: str):
+        """
+           Compiles a format, use compile_format to get cached plans.
+           Args:
+               fmt (str): a format with the directives of this module, or the name of one of the PRESETS.
+           Raises:
+               ValueError: If the format has an unknown directive.
+        """
+        self.format_string = PRESETS.get(fmt, fmt)
+        self.__tokens = [(token, token in DIRECTIVES) for token in _tokenize(self.format_string)]
+        fields = [_FIELDS[token] for token, directive in self.__tokens if token in _FIELDS]
+        self.parsable = sorted(fields) == ["day", "month", "year"]
+        self.layout = None
+        if all(token in _WIDTHS or not directive for token, directive in self.__tokens):
+            position, literals, slices = 0, [], {}
+            for token, directive in self.__tokens:
+                if directive:
+                    slices[_FIELDS[token]] = (position, position + _WIDTHS[token])
+                    position += _WIDTHS[token]
+                else:
+                    literals.append((position, token))
+                    position += 1
+            self.layout = (position, tuple(literals), slices)
+        self.split = None
+        runs = []
+        for token, directive in self.__tokens:
+            if directive or not runs or runs[-1][1]: runs.append((token, directive))
+            else: runs[-1] = (runs[-1][0] + token, False)
+        separators = [token for token, directive in runs if not directive]
+        if self.layout is None and runs and all(not (a[1] and b[1]) for a, b in zip(runs, runs[1:])) and \
+                not any(char.isalnum() for separator in separators for char in separator):
+            prefix = "" if runs[0][1] else runs.pop(0)[0]
+            suffix = "" if not runs or runs[-1][1] else runs.pop()[0]
+            self.split = (prefix, tuple(token for token, directive in runs if directive),
+                          tuple(token for token, directive in runs if not directive), suffix)
+        self.__pattern = re.compile("".join(_PATTERNS[token] if directive else re.escape(token) for token, directive in self.__tokens))
+
+    def parse(self, text: str) -> tuple:
+        """
+        Reads a date written in the format of the plan
+        :param text: the date string
+        :return: a tuple (day, month, year) of the date
+        """
+        if not self.parsable: raise ValueError(f"Invalid format: '{self.format_string}'. It must contain a day, a month and a year.")
+        if self.layout is not None:
+            width, literals, slices = self.layout
+            if type(text) != str or len(text) != width or any(text[position] != char for position, char in literals):
+                raise InvalidDateFormatError(text, self.format_string)
+            values = {}
+            for field, (start, end) in slices.items():
+                if not text[start:end].isdecimal(): raise InvalidDateFormatError(text, self.format_string)
+                values[field] = int(text[start:end])
+            weekday = None
+        else:
+            match = self.__pattern.fullmatch(text) if type(text) == str else None
+            if match is None: raise InvalidDateFormatError(text, self.format_string)
+            values, weekday = {}, None
+            for (token, _), value in zip([token for token in self.__tokens if token[1]], match.groups()):
+                if token == "%B": value = _MONTH_NAMES.get(value.casefold())
+                elif token == "%b": value = _MONTH_ABBREVIATIONS.get(value.casefold())
+                elif token == "%A":
+                    weekday = _WEEKDAY_NAMES.get(value.casefold())
+                    if weekday is None: raise InvalidDateFormatError(text, self.format_string)
+                    continue
+                if value is None: raise InvalidDateFormatError(text, self.format_string)
+                values[_FIELDS[token]] = int(value)
+        day, month, year = values["day"], values["month"], values["year"]
+        if year < 1 or month < 1 or month > 12 or day < 1 or day > from_month_to_days(year, month):
+            raise InvalidDateError(text)
+        if weekday is not None and weekday != (to_ordinal(year, month, day) - 1) % 7 + 1:
+            raise InvalidDateError(text)
+        return day, month, year
+
+    def format(self, year, month, day) -> str:
+        """
+        Writes a date in the format of the plan
+        :param year: year in number format
+        :param month: month in number format
+        :param day: day in number format
+        :return: the date string
+        """
+        parts = []
+        for token, directive in self.__tokens:
+            if not directive: parts.append(token)
+            elif token == "%d": parts.append(f"{day:02d}")
+            elif token == "%-d": parts.append(str(day))
+            elif token == "%m": parts.append(f"{month:02d}")
+            elif token == "%-m": parts.append(str(month))
+            elif token == "%Y": parts.append(f"{year:04d}")
+            elif token == "%B": parts.append(CALENDAR[month])
+            elif token == "%b": parts.append(CALENDAR[month][:3])
+            else: parts.append(WEEKDAYS[(to_ordinal(year, month, day) - 1) % 7 + 1])
+        return "".join(parts)
+
+@lru_cache(maxsize=256)
+def compile_format(fmt: str) -> FormatPlan:
+    """
+    Compiles a format into a plan, once per distinct format
+    :param fmt: a format with the directives of this module, or the name of one of the PRESETS
+    :return: a FormatPlan
+    """
+    return FormatPlan(fmt)
+
+def _split_strings(strings, plan):
+    """
+    Parses a column in a format with separators between its directives, see FormatPlan.split.
+    The column is cut at the separators with NumPy string functions and names are looked up once per distinct value.
+    Rows the fast path cannot accept are handed to the plan, which raises the same error the scalar parser would.
+    :return: the array of ordinals
+    """
+    from date_operations.array import _month_days, _to_ordinals
+    import numpy as np
+    prefix, directives, separators, suffix = plan.split
+    rest = np.asarray(strings, dtype=np.str_).reshape(-1)
+    if len(rest) == 0: return np.zeros(0, dtype=np.int64)
+    valid = np.ones(len(rest), dtype=bool)
+    if prefix:
+        before, found, rest = np.char.partition(rest, prefix).T
+        valid &= (before == "") & (found != "")
+    if suffix:
+        rest, found, after = np.char.rpartition(rest, suffix).T
+        valid &= (found != "") & (after == "")
+    fields = []
+    for separator in separators:
+        field, found, rest = np.char.partition(rest, separator).T
+        valid &= found != ""
+        fields.append(field)
+    fields.append(rest)
+    values = {}
+    for token, field in zip(directives, fields):
+        if token in _NAMES:
+            names, inverse = np.unique(field, return_inverse=True)
+            table = np.array([_NAMES[token].get(name.casefold(), 0) if name.isascii() and name.isalpha() and
+                              (token != "%b" or len(name) == 3) else 0 for name in names.tolist()], dtype=np.int64)
+            value = table[inverse.reshape(-1)]
+            valid &= value != 0
+        else:
+            shortest, longest = _LENGTHS[token]
+            length = np.char.str_len(field)
+            valid &= (length >= shortest) & (length <= longest)
+            width = min(field.dtype.itemsize // 4, longest)
+            codes = np.zeros((len(field), longest), dtype=np.int64)
+            codes[:, :width] = np.ascontiguousarray(field).view(np.uint32).reshape(len(field), -1)[:, :width]
+            value = np.zeros(len(field), dtype=np.int64)
+            for position in range(longest):
+                present = position < length
+                valid &= ~present | ((codes[:, position] >= 48) & (codes[:, position] <= 57))
+                value = np.where(present, value*10 + codes[:, position] - 48, value)
+        values[_FIELDS.get(token, "weekday")] = value
+    day, month, year = values["day"], values["month"], values["year"]
+    valid &= (year >= 1) & (month >= 1) & (month <= 12)
+    month = np.where(valid, month, 1)
+    valid &= (day >= 1) & (day <= _month_days(year, month))
+    ordinals = _to_ordinals(year, month, day)
+    if "weekday" in values: valid &= values["weekday"] == (ordinals - 1) % 7 + 1
+    for index in np.nonzero(~valid)[0]:
+        day, month, year = plan.parse(strings[index])
+        ordinals[index] = to_ordinal(year, month, day)
+    return ordinals
+
+def parse_many(strings, fmt: str):
+    """
+    Parses a whole column of dates written in the same format, requires NumPy.
+    Fixed-width formats are parsed in one vectorized pass, formats with separators by splitting the column,
+    the others row by row with the compiled plan.
+    :param strings: a sequence of date strings
+    :param fmt: a format with the directives of this module, or the name of one of the PRESETS
+    :return: a DateArray
+    """
+    from date_operations.array import DateArray, _parse_strings
+    import numpy as np
+    plan = compile_format(fmt)
+    if plan.layout is not None and plan.parsable:
+        return DateArray.from_ordinals(_parse_strings(strings, plan))
+    if plan.split is not None and plan.parsable:
+        return DateArray.from_ordinals(_split_strings(strings, plan))
+    ordinals = np.empty(len(strings), dtype=np.int64)
+    for index, text in enumerate(strings):
+        day, month, year = plan.parse(text)
+        ordinals[index] = to_ordinal(year, month, day)
+    return DateArray.from_ordinals(ordinals)
@@ -0,0 +1,169 @@
+"""
+Sorted date index
+
+DateIndex keeps records keyed by date in a sorted array('i') of ordinals with a parallel list of values.
+Range queries and nearest-date lookups are binary searches. New records go to a small sorted buffer,
+merged into the main array once it grows past the square root of the index size.
+"""
+from date_operations.custom_exceptions import InvalidDateError, InvalidDateFormatError
+from date_operations.date import Date, from_ordinal, ordinal_of
+from array import array
+from bisect import bisect_left, bisect_right
+from heapq import merge
+
+MIN_BUFFER = 1024
+
+def _date(ordinal):
+    return Date._from_fields(*from_ordinal(ordinal), ordinal)
+
+class DateIndex:
+    def __init__(self, dates=(), values=None):
+        """
+           Initializes the DateIndex instance.
+           Args:
+               dates: an iterable of Date objects or dd-mm-yyyy strings.
+               values: an iterable with the record of each date, by default every record is None.
+        """
+        self.__ordinals, self.__values = array("i"), []
+        self.__pending_ordinals, self.__pending_values = [], []
+        self.update(dates, values)
+
+    def update(self, dates, values=None) -> None:
+        """
+        Inserts many records at once, sorting them together with the ones already indexed
+        :param dates: an iterable of Date objects or dd-mm-yyyy strings
+        :param values: an iterable with the record of each date, by default every record is None
+        :return: None
+        """
+        ordinals = [ordinal_of(date) for date in dates]
+        values = [None]*len(ordinals) if values is None else list(values)
+        if len(values) != len(ordinals): raise ValueError("dates and values must have the same length.")
+        order = sorted(range(len(ordinals)), key=ordinals.__getitem__)
+        self.__merge([ordinals[index] for index in order], [values[index] for index in order])
+
+    def add(self, date, value=None) -> None:
+        """
+        Inserts one record, in amortized O(sqrt(n)) time
+        :param date: a Date or a string in dd-mm-yyyy format
+        :param value: the record of the date
+        :return: None
+        """
+        ordinal = ordinal_of(date)
+        index = bisect_right(self.__pending_ordinals, ordinal)
+        self.__pending_ordinals.insert(index, ordinal)
+        self.__pending_values.insert(index, value)
+        if len(self.__pending_ordinals) > max(MIN_BUFFER, int(len(self.__ordinals) ** 0.5)):
+            self.__merge([], [])
+
+    def __merge(self, ordinals, values) -> None:
+        """
+        Private method that merges the buffer and already sorted new records into the main array
+        """
+        items = merge(zip(self.__ordinals, self.__values), zip(self.__pending_ordinals, self.__pending_values),
+                      zip(ordinals, values), key=lambda item: item[0])
+        merged_ordinals, merged_values = array("i"), []
+        for ordinal, value in items:
+            merged_ordinals.append(ordinal)
+            merged_values.append(value)
+        self.__ordinals, self.__values = merged_ordinals, merged_values
+        self.__pending_ordinals, self.__pending_values = [], []
+
+    def __slices(self, low, high):
+        """
+        Private method returning the records with low <= ordinal < high, in order
+        """
+        main_start, main_end = bisect_left(self.__ordinals, low), bisect_left(self.__ordinals, high)
+        pending_start, pending_end = bisect_left(self.__pending_ordinals, low), bisect_left(self.__pending_ordinals, high)
+        return merge(zip(self.__ordinals[main_start:main_end], self.__values[main_start:main_end]),
+                     zip(self.__pending_ordinals[pending_start:pending_end], self.__pending_values[pending_start:pending_end]),
+                     key=lambda item: item[0])
+
+    def between(self, start, end) -> list:
+        """
+        Returns the records between two dates, both included.
+        :param start: a Date or a string in dd-mm-yyyy format
+        :param end: a Date or a string in dd-mm-yyyy format
+        :return: a list of (Date, value) tuples sorted by date
+        """
+        return [(_date(ordinal), value) for ordinal, value in self.__slices(ordinal_of(start), ordinal_of(end) + 1)]
+
+    def count_between(self, start, end) -> int:
+        """
+        Counts the records between two dates, both included, in O(log n) time.
+        :param start: a Date or a string in dd-mm-yyyy format
+        :param end: a Date or a string in dd-mm-yyyy format
+        :return: the number of records
+        """
+        low, high = ordinal_of(start), ordinal_of(end) + 1
+        if high <= low: return 0
+        return bisect_left(self.__ordinals, high) - bisect_left(self.__ordinals, low) + \
+            bisect_left(self.__pending_ordinals, high) - bisect_left(self.__pending_ordinals, low)
+
+    def floor(self, date):
+        """
+        Returns the last record on or before a date.
+        :param date: a Date or a string in dd-mm-yyyy format
+        :return: a (Date, value) tuple, None if there is no such record
+        """
+        ordinal = ordinal_of(date)
+        candidates = []
+        for ordinals, values in ((self.__ordinals, self.__values), (self.__pending_ordinals, self.__pending_values)):
+            index = bisect_right(ordinals, ordinal)
+            if index: candidates.append((ordinals[index - 1], values[index - 1]))
+        if not candidates: return None
+        ordinal, value = max(reversed(candidates), key=lambda item: item[0])
+        return _date(ordinal), value
+
+    def ceil(self, date):
+        """
+        Returns the first record on or after a date.
+        :param date: a Date or a string in dd-mm-yyyy format
+        :return: a (Date, value) tuple, None if there is no such record
+        """
+        ordinal = ordinal_of(date)
+        candidates = []
+        for ordinals, values in ((self.__ordinals, self.__values), (self.__pending_ordinals, self.__pending_values)):
+            index = bisect_left(ordinals, ordinal)
+            if index < len(ordinals): candidates.append((ordinals[index], values[index]))
+        if not candidates: return None
+        ordinal, value = min(candidates, key=lambda item: item[0])
+        return _date(ordinal), value
+
+    def nearest(self, date):
+        """
+        Returns the record closest to a date, the earlier one when two are at the same distance.
+        :param date: a Date or a string in dd-mm-yyyy format
+        :return: a (Date, value) tuple, None if the index is empty
+        """
+        before, after = self.floor(date), self.ceil(date)
+        if before is None or after is None: return before or after
+        ordinal = ordinal_of(date)
+        return before if ordinal - before[0].ordinal <= after[0].ordinal - ordinal else after
+
+    def ordinals(self) -> array:
+        """
+        Returns the sorted ordinals of all the records
+        :return: an array('i') of ordinals
+        """
+        if self.__pending_ordinals: self.__merge([], [])
+        return array("i", self.__ordinals)
+
+    def __len__(self) -> int:
+        return len(self.__ordinals) + len(self.__pending_ordinals)
+
+    def __contains__(self, date) -> bool:
+        if not isinstance(date, (Date, str)): return False
+        try:
+            ordinal = ordinal_of(date)
+        except (InvalidDateFormatError, InvalidDateError):
+            return False
+        return any(index < len(ordinals) and ordinals[index] == ordinal for ordinals, index in (
+            (self.__ordinals, bisect_left(self.__ordinals, ordinal)),
+            (self.__pending_ordinals, bisect_left(self.__pending_ordinals, ordinal))))
+
+    def __iter__(self):
+        """
+        Iterates over the records as (Date, value) tuples sorted by date
+        """
+        for ordinal, value in self.__slices(-2**31, 2**31 - 1):
+            yield _date(ordinal), value
@@ -0,0 +1,67 @@
+"""
+Difference matrices
+
+Computes the difference between every date of a set and every date of another one, in any unit of the
+*_between methods of Date and with the same rounding. Both sets are decoded once into vectors of ordinals and
+fields, then the matrix is filled block by block with the broadcasting functions of date_operations.array,
+so the temporary arrays never grow past one block whatever the size of the inputs. Requires NumPy.
+"""
+from date_operations.array import DateArray, days_between, months_between, years_between, _as_ordinals, _from_ordinals, _round
+import numpy as np
+
+UNITS = ("seconds", "minutes", "hours", "days", "weeks", "months", "years")
+BLOCK_SIZE = 1024
+_SCALES = {"seconds": 24*60*60, "minutes": 24*60, "hours": 24, "days": 1}
+
+def _columns(dates) -> tuple:
+    """
+    Decodes a set of dates into a tuple (ordinals, year, month, day) of 1-d arrays
+    """
+    ordinals = np.asarray(_as_ordinals(dates), dtype=np.int64).reshape(-1)
+    return (ordinals, *_from_ordinals(ordinals))
+
+def _block(unit, rows, columns) -> np.ndarray:
+    """
+    Computes the differences between the dates of rows, as a column vector, and the dates of columns, as a row vector
+    """
+    if unit in _SCALES:
+        return days_between(rows[0][:, None], columns[0][None, :]) * _SCALES[unit]
+    if unit == "weeks":
+        return _round(days_between(rows[0][:, None], columns[0][None, :]) / 7)
+    between = months_between if unit == "months" else years_between
+    return between(*(field[:, None] for field in rows[1:]), *(field[None, :] for field in columns[1:]))
+
+def iter_difference_blocks(dates, others, unit: str = "days", block_rows: int = BLOCK_SIZE, block_columns: int = BLOCK_SIZE):
+    """
+    Computes the difference matrix one block at a time, for inputs whose full matrix does not fit in memory
+    :param dates: a DateArray or a sequence of dates, the rows of the matrix
+    :param others: a DateArray or a sequence of dates, the columns of the matrix
+    :param unit: one of UNITS
+    :param block_rows: the maximum number of rows of a block
+    :param block_columns: the maximum number of columns of a block
+    :return: a generator of (row, column, block) tuples, where row and column are the offsets of the block in the matrix
+    """
+    if unit not in UNITS: raise ValueError(f"Invalid unit: '{unit}'. Use one of {UNITS}.")
+    if type(block_rows) != int or type(block_columns) != int or block_rows < 1 or block_columns < 1:
+        raise ValueError(f"Invalid block size: '{(block_rows, block_columns)}'. Use positive integers.")
+    rows, columns = _columns(dates), _columns(others)
+    for row in range(0, len(rows[0]), block_rows):
+        row_fields = tuple(field[row:row + block_rows] for field in rows)
+        for column in range(0, len(columns[0]), block_columns):
+            yield row, column, _block(unit, row_fields, tuple(field[column:column + block_columns] for field in columns))
+
+def difference_matrix(dates, others, unit: str = "days") -> np.ndarray:
+    """
+    Computes the difference between every pair of dates of two sets
+    :param dates: a DateArray or a sequence of dates, the rows of the matrix
+    :param others: a DateArray or a sequence of dates, the columns of the matrix
+    :param unit: one of UNITS
+    :return: an N×M array, integers for seconds, minutes, hours and days, floats rounded to two decimals otherwise
+    """
+    dates = dates if isinstance(dates, DateArray) else DateArray(dates)
+    others = others if isinstance(others, DateArray) else DateArray(others)
+    dtype = np.int64 if unit in _SCALES else np.float64
+    result = np.empty((len(dates), len(others)), dtype=dtype)
+    for row, column, block in iter_difference_blocks(dates, others, unit):
+        result[row:row + block.shape[0], column:column + block.shape[1]] = block
+    return result
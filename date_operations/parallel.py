@@ -0,0 +1,178 @@
+"""
+Parallel batch differences
+
+Computes days_between, months_between or years_between for many pairs of dates on a pool of processes.
+Date objects are sent to the workers as buffers of 4-byte ordinals, date strings as they are, to be parsed
+there in one vectorized pass when NumPy is installed; results come back as buffers of numbers, so no Date
+object is ever pickled. Small inputs are computed in the current process.
+"""
+from date_operations.custom_exceptions import InvalidDateError, InvalidDateFormatError
+from date_operations.date import Date, from_ordinal, ordinal_of, months_between, years_between
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from collections import deque
+from array import array
+from itertools import islice, chain
+import os
+
+try:
+    from date_operations.array import _parse_strings
+except ImportError:
+    _parse_strings = None
+
+UNITS = ("days", "months", "years")
+CHUNK_SIZE = 100000
+MIN_PARALLEL = 200000
+
+def _compute(unit, left, right) -> array:
+    """
+    Computes the differences between two arrays of ordinals
+    :return: an array of integers for days, of floats for months and years
+    """
+    if unit == "days":
+        return array("q", [abs(a - b) for a, b in zip(left, right)])
+    between = months_between if unit == "months" else years_between
+    result = array("d")
+    for a, b in zip(left, right):
+        year, month, day = from_ordinal(a)
+        other_year, other_month, other_day = from_ordinal(b)
+        result.append(between(year, month, day, other_year, other_month, other_day))
+    return result
+
+def _decode(typecode, data) -> array:
+    result = array(typecode)
+    result.frombytes(data)
+    return result
+
+def _encode(dates) -> tuple:
+    """
+    Encodes one side of a chunk as a buffer of ordinals, 0 where the date is a string, and the list of strings
+    :return: a tuple (buffer, strings), the buffer is None if every date is a string, strings None if there are none
+    """
+    ordinals, strings = array("i"), []
+    for date in dates:
+        if isinstance(date, Date):
+            ordinals.append(date.ordinal)
+        elif type(date) == str:
+            ordinals.append(0)
+            strings.append(date)
+        else:
+            raise TypeError(f"Invalid date: '{date}'. Use a Date or a string in dd-mm-yyyy format.")
+    return ordinals.tobytes() if len(strings) < len(ordinals) else None, strings or None
+
+def _ordinals(side) -> array:
+    """
+    Decodes one side of a chunk encoded by _encode, parsing its strings
+    """
+    buffer, strings = side
+    parsed = None
+    if strings:
+        parsed = _parse_strings(strings).tolist() if _parse_strings is not None else [ordinal_of(date) for date in strings]
+    if buffer is None: return array("i", parsed)
+    ordinals = _decode("i", buffer)
+    if parsed:
+        positions = [index for index, ordinal in enumerate(ordinals) if ordinal == 0]
+        for index, ordinal in zip(positions, parsed):
+            ordinals[index] = ordinal
+    return ordinals
+
+def _run_chunk(unit, start, left, right) -> tuple:
+    """
+    Worker entry point, receives and returns raw buffers.
+    A chunk with an invalid date returns no buffer, it is parsed again in the parent process to raise the error.
+    """
+    try:
+        result = _compute(unit, _ordinals(left), _ordinals(right))
+    except (InvalidDateFormatError, InvalidDateError):
+        return start, None, None
+    return start, result.typecode, result.tobytes()
+
+def _chunks(pairs, chunk_size):
+    """
+    Encodes the pairs with _encode, chunk_size pairs at a time
+    :return: a generator of (start, size, left, right) tuples
+    """
+    pairs = iter(pairs)
+    start = 0
+    while True:
+        chunk = list(islice(pairs, chunk_size))
+        if not chunk: return
+        yield start, len(chunk), _encode([date for date, _ in chunk]), _encode([other for _, other in chunk])
+        start += len(chunk)
+
+def iter_between(pairs, unit="days", workers=None, chunk_size=CHUNK_SIZE, ordered=True, min_parallel=MIN_PARALLEL):
+    """
+    Computes the difference between every pair of dates, see between_many
+    :return: a generator of values, or of (index, value) tuples if ordered is False
+    """
+    if unit not in UNITS: raise ValueError(f"Invalid unit: '{unit}'. Use one of {UNITS}.")
+    if type(chunk_size) != int or chunk_size < 1: raise ValueError(f"Invalid chunk size: '{chunk_size}'.")
+    chunks = _chunks(pairs, chunk_size)
+    read_ahead, size = [], 0
+    for chunk in chunks:
+        read_ahead.append(chunk)
+        size += chunk[1]
+        if size >= min_parallel: break
+    small = size < min_parallel or not read_ahead
+    chunks = chain(read_ahead, chunks)
+    if workers == 1 or small:
+        for start, _, left, right in chunks:
+            for index, value in enumerate(_compute(unit, _ordinals(left), _ordinals(right)), start):
+                yield value if ordered else (index, value)
+        return
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        def submit():
+            for start, _, left, right in islice(chunks, 2*workers - len(pending)):
+                pending.append((left, right, executor.submit(_run_chunk, unit, start, left, right)))
+        submit()
+        while pending:
+            if ordered:
+                done = [pending.popleft()]
+            else:
+                finished, _ = wait([future for _, _, future in pending], return_when=FIRST_COMPLETED)
+                done = [item for item in pending if item[2] in finished]
+                for item in done: pending.remove(item)
+            for left, right, future in done:
+                start, typecode, data = future.result()
+                values = _compute(unit, _ordinals(left), _ordinals(right)) if data is None else _decode(typecode, data)
+                for index, value in enumerate(values, start):
+                    yield value if ordered else (index, value)
+            submit()
+
+def between_many(pairs, unit="days", workers=None, chunk_size=CHUNK_SIZE, ordered=True, min_parallel=MIN_PARALLEL) -> list:
+    """
+    Computes the difference between every pair of dates on a pool of processes
+    :param pairs: an iterable of (date, other) tuples, each a Date or a string in dd-mm-yyyy format, other types raise TypeError
+    :param unit: "days", "months" or "years", as computed by the Date methods of the same name
+    :param workers: the number of processes, by default the number of CPUs; 1 computes in the current process
+    :param chunk_size: the number of pairs sent to a worker at a time
+    :param ordered: if False the results are returned as (index, value) tuples, in the order they are ready
+    :param min_parallel: inputs with fewer pairs than this are computed in the current process
+    :return: a list of differences, integers for days and floats for months and years
+    """
+    return list(iter_between(pairs, unit, workers, chunk_size, ordered, min_parallel))
+
+def days_between_many(pairs, **options) -> list:
+    """
+    Parallel version of Date.days_between, see between_many for the options
+    :param pairs: an iterable of (date, other) tuples
+    :return: a list of differences in days
+    """
+    return between_many(pairs, "days", **options)
+
+def months_between_many(pairs, **options) -> list:
+    """
+    Parallel version of Date.months_between, see between_many for the options
+    :param pairs: an iterable of (date, other) tuples
+    :return: a list of differences in months
+    """
+    return between_many(pairs, "months", **options)
+
+def years_between_many(pairs, **options) -> list:
+    """
+    Parallel version of Date.years_between, see between_many for the options
+    :param pairs: an iterable of (date, other) tuples
+    :return: a list of differences in years
+    """
+    return between_many(pairs, "years", **options)
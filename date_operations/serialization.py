@@ -0,0 +1,62 @@
+"""
+Compact binary serialization of many dates
+
+A buffer of dates is the sequence of their ordinals as 4-byte little-endian signed integers, the same
+encoding as Date.to_bytes, with no header. Loading reads the buffer through a memoryview, without copying it.
+"""
+from date_operations.date import Date, MIN_ORDINAL, MAX_ORDINAL, from_ordinal
+from array import array
+import sys
+
+def _ordinals(dates) -> array:
+    ordinals = array("i", (date.ordinal if isinstance(date, Date) else Date(date).ordinal for date in dates))
+    if sys.byteorder == "big": ordinals.byteswap()
+    return ordinals
+
+def dumps_many(dates) -> bytes:
+    """
+    Serializes many dates at once
+    :param dates: an iterable of Date objects or dd-mm-yyyy strings, or a DateArray
+    :return: 4 bytes per date
+    """
+    array_module = sys.modules.get("date_operations.array")
+    if array_module is not None and isinstance(dates, array_module.DateArray):
+        return dates.ordinals.astype("<i4").tobytes()
+    return _ordinals(dates).tobytes()
+
+def iter_loads(buffer):
+    """
+    Reads the dates of a buffer one at a time, without copying the buffer
+    :param buffer: bytes, bytearray, memoryview or any object supporting the buffer protocol
+    :return: a generator of Date objects
+    """
+    view = memoryview(buffer).cast("B")
+    if len(view) % 4: raise ValueError(f"Invalid buffer: its length {len(view)} is not a multiple of 4.")
+    for ordinal in (view.cast("i") if sys.byteorder == "little" else _swapped(view)):
+        if ordinal < MIN_ORDINAL or ordinal > MAX_ORDINAL:
+            raise ValueError(f"Invalid ordinal: '{ordinal}'. Use an integer between {MIN_ORDINAL} and {MAX_ORDINAL}.")
+        year, month, day = from_ordinal(ordinal)
+        yield Date._from_fields(year, month, day, ordinal)
+
+def _swapped(view):
+    ordinals = array("i", view.tobytes())
+    ordinals.byteswap()
+    return ordinals
+
+def loads_many(buffer) -> list:
+    """
+    Deserializes a buffer written by dumps_many
+    :param buffer: bytes, bytearray, memoryview or any object supporting the buffer protocol
+    :return: a list of Date objects
+    """
+    return list(iter_loads(buffer))
+
+def loads_array(buffer):
+    """
+    Deserializes a buffer written by dumps_many into a DateArray, requires NumPy
+    :param buffer: bytes, bytearray, memoryview or any object supporting the buffer protocol
+    :return: a DateArray
+    """
+    from date_operations.array import DateArray
+    import numpy as np
+    return DateArray.from_ordinals(np.frombuffer(buffer, dtype="<i4"))
@@ -0,0 +1,186 @@
+"""
+Asyncio batch service
+
+DateService answers days_between, add_days and full_date requests from coroutines. Requests arriving within a
+short window are gathered into one batch, identical requests still waiting for a result share a single
+computation, and each batch runs in an executor through loop.run_in_executor, so the event loop never blocks.
+"""
+from date_operations.custom_exceptions import InvalidDateError, InvalidDateFormatError
+from date_operations.date import Date, ordinal_of
+import asyncio
+
+WINDOW = 0.002
+MAX_BATCH = 1024
+
+def _key(date):
+    """
+    Ordinal of a date, so that the same day given as a Date or as a string makes the same request.
+    An invalid date is kept as it is, the batch raises its error through the future of the request.
+    """
+    try:
+        return ordinal_of(date)
+    except (InvalidDateFormatError, InvalidDateError):
+        return date
+
+def _ordinal(key) -> int:
+    return key if type(key) == int else ordinal_of(key)
+
+def _date(key):
+    return Date.from_ordinal(key) if type(key) == int else Date(key)
+
+_OPERATIONS = {
+    "days_between": lambda date, other: abs(_ordinal(date) - _ordinal(other)),
+    "add_days": lambda date, days: _date(date).plus_days(days),
+    "full_date": lambda date: _date(date).full_date,
+}
+
+def _run_batch(batch) -> list:
+    """
+    Computes a batch of operations in the executor
+    :return: a list of (error, value) tuples in the order of the batch
+    """
+    results = []
+    for name, *args in batch:
+        try:
+            results.append((None, _OPERATIONS[name](*args)))
+        except Exception as error:
+            results.append((error, None))
+    return results
+
+class DateService:
+    def __init__(self, window: float = WINDOW, max_batch: int = MAX_BATCH, executor=None):
+        """
+           Initializes the DateService instance, use it from a running event loop.
+           Args:
+               window (float): the seconds a request waits for others to join its batch.
+               max_batch (int): the number of distinct requests that dispatches a batch before the window ends.
+               executor: the concurrent.futures executor of the batches, by default the one of the event loop.
+           Raises:
+               ValueError: If the window is negative or max_batch is not a positive integer.
+        """
+        if window < 0: raise ValueError(f"Invalid window: '{window}'.")
+        if type(max_batch) != int or max_batch < 1: raise ValueError(f"Invalid batch size: '{max_batch}'.")
+        self.__window, self.__max_batch, self.__executor = window, max_batch, executor
+        self.__futures, self.__queue, self.__timer, self.__tasks = {}, [], None, set()
+        self.__in_flight = 0
+        self.__stats = {"requests": 0, "coalesced": 0, "batches": 0, "operations": 0, "last_batch_size": 0, "max_batch_size": 0}
+
+    async def days_between(self, date, other) -> int:
+        """
+        Batched version of Date.days_between
+        :param date: a Date or a string in dd-mm-yyyy format
+        :param other: is a different date to compare
+        :return: difference in days
+        """
+        return await self.__submit("days_between", _key(date), _key(other))
+
+    async def add_days(self, date, days: int):
+        """
+        Batched version of Date.plus_days
+        :param date: a Date or a string in dd-mm-yyyy format
+        :param days: The number of days to add to the date.
+        :return: a new Date object, the original date is not modified
+        """
+        return (await self.__submit("add_days", _key(date), days)).copy()
+
+    async def full_date(self, date) -> str:
+        """
+        Batched version of Date.full_date
+        :param date: a Date or a string in dd-mm-yyyy format
+        :return: full date in string format
+        """
+        return await self.__submit("full_date", _key(date))
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        Given a service
+        :return: the number of distinct requests waiting for their batch to be dispatched
+        """
+        return len(self.__queue)
+
+    @property
+    def in_flight(self) -> int:
+        """
+        Given a service
+        :return: the number of distinct requests dispatched and not yet answered
+        """
+        return self.__in_flight
+
+    def metrics(self) -> dict:
+        """
+        Statistics collected since the service was created
+        :return: a dictionary with "requests", "coalesced", "batches", "operations", "last_batch_size",
+                 "max_batch_size", "mean_batch_size", "queue_depth" and "in_flight"
+        """
+        metrics = dict(self.__stats)
+        metrics["mean_batch_size"] = metrics["operations"] / metrics["batches"] if metrics["batches"] else 0
+        metrics["queue_depth"], metrics["in_flight"] = self.queue_depth, self.in_flight
+        return metrics
+
+    async def close(self) -> None:
+        """
+        Dispatches the requests still waiting and waits for every batch to be answered
+        :return: None
+        """
+        self.__flush()
+        if self.__tasks: await asyncio.gather(*self.__tasks)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def __submit(self, *operation):
+        """
+        Private method that joins an identical pending request or queues a new one
+        """
+        loop = asyncio.get_running_loop()
+        self.__stats["requests"] += 1
+        future = self.__futures.get(operation)
+        if future is not None:
+            self.__stats["coalesced"] += 1
+        else:
+            future = self.__futures[operation] = loop.create_future()
+            self.__queue.append(operation)
+            if len(self.__queue) >= self.__max_batch:
+                self.__flush()
+            elif self.__timer is None:
+                self.__timer = loop.call_later(self.__window, self.__flush)
+        return await asyncio.shield(future)
+
+    def __flush(self) -> None:
+        """
+        Private method that dispatches the queued requests as one batch
+        """
+        if self.__timer is not None:
+            self.__timer.cancel()
+            self.__timer = None
+        if not self.__queue: return
+        batch, self.__queue = self.__queue, []
+        self.__in_flight += len(batch)
+        self.__stats["batches"] += 1
+        self.__stats["operations"] += len(batch)
+        self.__stats["last_batch_size"] = len(batch)
+        self.__stats["max_batch_size"] = max(self.__stats["max_batch_size"], len(batch))
+        task = asyncio.get_running_loop().create_task(self.__dispatch(batch))
+        self.__tasks.add(task)
+        task.add_done_callback(self.__tasks.discard)
+
+    async def __dispatch(self, batch) -> None:
+        """
+        Private method that runs a batch in the executor and answers its requests
+        """
+        try:
+            results = await asyncio.get_running_loop().run_in_executor(self.__executor, _run_batch, batch)
+        except Exception as error:
+            results = [(error, None)] * len(batch)
+        self.__in_flight -= len(batch)
+        for operation, (error, value) in zip(batch, results):
+            future = self.__futures.pop(operation)
+            if future.cancelled(): continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(value)
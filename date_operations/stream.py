@@ -0,0 +1,97 @@
+"""
+Streaming validation of large date files
+
+Reads dd-mm-yyyy strings one line at a time, in fixed-size chunks, and reports every row with its line number
+instead of stopping at the first invalid date. Memory use does not depend on the size of the input.
+
+Command line usage:
+    python -m date_operations.stream dates.txt --output ordinal --errors-only
+"""
+from date_operations.date import scan_date, to_ordinal
+from typing import NamedTuple
+import argparse, sys
+
+CHUNK_SIZE = 1 << 20
+OUTPUTS = ("date", "ordinal")
+
+class Row(NamedTuple):
+    line: int
+    text: str
+    value: object
+    error: object
+
+def validate_lines(lines, output="date", errors_only=False, start=1):
+    """
+    Validates an iterable of date strings with the rules of the Date constructor, only line endings are ignored
+    :param lines: an iterable of strings in dd-mm-yyyy format
+    :param output: "date" to get the date string back, "ordinal" to get its ordinal
+    :param errors_only: if True only the invalid rows are produced
+    :param start: the line number of the first string
+    :return: a generator of Row(line, text, value, error), value is None for invalid rows and
+        error is the exception class Date(...) would raise, None for valid rows
+    """
+    if output not in OUTPUTS: raise ValueError(f"Invalid output: '{output}'. Use one of {OUTPUTS}.")
+    for line, text in enumerate(lines, start):
+        text = text.rstrip("\r\n")
+        fields = scan_date(text)
+        if type(fields) != tuple:
+            yield Row(line, text, None, fields)
+        elif not errors_only:
+            yield Row(line, text, text if output == "date" else to_ordinal(fields[2], fields[1], fields[0]), None)
+
+def read_lines(file, chunk_size=CHUNK_SIZE):
+    """
+    Reads the lines of a binary file in chunks, without loading the whole file
+    :param file: a path or a file object opened in binary mode
+    :param chunk_size: the number of bytes read at a time
+    :return: a generator of decoded lines
+    """
+    if isinstance(file, (str, bytes)) or hasattr(file, "__fspath__"):
+        with open(file, "rb") as opened:
+            yield from read_lines(opened, chunk_size)
+        return
+    rest = b""
+    while True:
+        chunk = file.read(chunk_size)
+        if not chunk: break
+        lines = (rest + chunk).split(b"\n")
+        rest = lines.pop()
+        for line in lines:
+            yield line.decode("utf-8", "replace")
+    if rest:
+        yield rest.decode("utf-8", "replace")
+
+def validate_file(file, output="date", errors_only=False, chunk_size=CHUNK_SIZE):
+    """
+    Validates every line of a file of dates
+    :param file: a path or a file object opened in binary mode
+    :param output: "date" to get the date string back, "ordinal" to get its ordinal
+    :param errors_only: if True only the invalid rows are produced
+    :param chunk_size: the number of bytes read at a time
+    :return: a generator of Row(line, text, value, error), see validate_lines
+    """
+    return validate_lines(read_lines(file, chunk_size), output, errors_only)
+
+def main(argv=None) -> int:
+    """
+    Command line entry point: valid values go to stdout, invalid rows to stderr
+    :return: 0 if every row is valid, 1 otherwise
+    """
+    parser = argparse.ArgumentParser(prog="python -m date_operations.stream", description="Validate a file of dd-mm-yyyy dates.")
+    parser.add_argument("file", help="the file to validate, - for standard input")
+    parser.add_argument("--output", choices=OUTPUTS, default="date", help="what to print for valid rows")
+    parser.add_argument("--errors-only", action="store_true", help="print only the invalid rows")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="bytes read at a time")
+    args = parser.parse_args(argv)
+    file = sys.stdin.buffer if args.file == "-" else args.file
+    invalid = 0
+    for row in validate_file(file, args.output, args.errors_only, args.chunk_size):
+        if row.error is None:
+            sys.stdout.write(f"{row.value}\n")
+        else:
+            invalid += 1
+            sys.stderr.write(f"line {row.line}: {row.error.__name__}: '{row.text}'\n")
+    return 1 if invalid else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
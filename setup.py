@@ -5,6 +5,7 @@ setup(
     version='0.1.0',
     packages=find_packages(),
     install_requires=[],
+    extras_require={'numpy': ['numpy']},
     author='Roberto Parodo',
     description='A set of powerful and easy-to-use methods for handling dates efficiently',
     long_description=open('README.md').read(),
@@ -0,0 +1,79 @@
+from date_operations.custom_exceptions import InvalidDateError, InvalidDateFormatError, InvalidDateAdd, InvalidDateRemove
+
+from date_operations import Date
+import pytest
+
+np = pytest.importorskip("numpy")
+from date_operations.array import DateArray
+
+DATES = ["24-01-2000", "10-09-1953", "29-02-2000", "31-12-9999", "01-01-0001"]
+OTHERS = ["10-09-1953", "24-01-2000", "28-02-2001", "01-01-0001", "24-01-0001"]
+
+def test_parse():
+    dates = DateArray(DATES)
+    assert len(dates) == 5
+    assert dates.ordinals.tolist() == [Date(date).ordinal for date in DATES]
+    assert [str(date) for date in dates] == DATES
+    assert str(DateArray([Date(date) for date in DATES])[2]) == "29-02-2000"
+
+def test_parse_errors():
+    with pytest.raises(InvalidDateFormatError):
+        DateArray(["24-01-2000", "2000-01-24"])
+    with pytest.raises(InvalidDateError):
+        DateArray(["24-01-2000", "29-02-1900"])
+    with pytest.raises(InvalidDateError):
+        DateArray(["24-01-2000", "01-01-0000"])
+
+def test_fields():
+    dates = DateArray(DATES)
+    assert dates.day.tolist() == [24, 10, 29, 31, 1]
+    assert dates.month.tolist() == [1, 9, 2, 12, 1]
+    assert dates.year.tolist() == [2000, 1953, 2000, 9999, 1]
+    assert dates.is_leap.tolist() == [Date(date).is_leap for date in DATES]
+    assert dates.century.tolist() == [Date(date).century for date in DATES]
+    assert dates.get_weekday().tolist() == [Date(date).get_weekday() for date in DATES]
+
+@pytest.mark.parametrize("method", ["days_between", "week_between", "months_between", "years_between",
+                                    "hours_between", "minutes_between", "second_between"])
+def test_between(method):
+    result = getattr(DateArray(DATES), method)(DateArray(OTHERS))
+    assert result.tolist() == [getattr(Date(date), method)(Date(other)) for date, other in zip(DATES, OTHERS)]
+
+def test_between_scalar():
+    assert DateArray(DATES).days_between("24-01-2000").tolist() == [Date(date).days_between("24-01-2000") for date in DATES]
+
+def test_add_days_months():
+    dates = DateArray(["24-01-2000", "31-01-2000"])
+    assert [str(date) for date in dates.add_days(100)] == ["03-05-2000", "10-05-2000"]
+    assert [str(date) for date in dates.add_months([1, 13])] == ["24-02-2000", "28-02-2001"]
+    assert [str(date) for date in dates.remove_months(1)] == ["24-12-1999", "31-12-1999"]
+    assert [str(date) for date in dates.remove_days(24)] == ["31-12-1999", "07-01-2000"]
+    assert [str(date) for date in dates] == ["24-01-2000", "31-01-2000"]
+    with pytest.raises(InvalidDateAdd):
+        dates.add_days(-1)
+    with pytest.raises(InvalidDateAdd):
+        DateArray(["31-12-9999"]).add_months(1)
+    with pytest.raises(InvalidDateRemove):
+        DateArray(["01-01-0001"]).remove_days(1)
+
+def test_comparisons():
+    dates, others = DateArray(DATES), DateArray(OTHERS)
+    assert (dates > others).tolist() == [Date(a) > Date(b) for a, b in zip(DATES, OTHERS)]
+    assert (dates <= others).tolist() == [Date(a) <= Date(b) for a, b in zip(DATES, OTHERS)]
+    assert (dates == "24-01-2000").tolist() == [True, False, False, False, False]
+
+def test_datetime64():
+    values = np.array(["2000-01-24", "1953-09-10", "0001-01-01", "9999-12-31"], dtype="datetime64[D]")
+    dates = DateArray.from_datetime64(values)
+    assert [str(date) for date in dates] == ["24-01-2000", "10-09-1953", "01-01-0001", "31-12-9999"]
+    assert (dates.to_datetime64() == values).all()
+    assert str(DateArray.from_datetime64(np.array(["2000-01-24T23:59"], dtype="datetime64[m]"))[0]) == "24-01-2000"
+    with pytest.raises(ValueError):
+        DateArray.from_datetime64(np.array(["NaT"], dtype="datetime64[D]"))
+
+def test_pydates():
+    import datetime
+    values = [datetime.date(2000, 1, 24), datetime.date(1953, 9, 10)]
+    dates = DateArray.from_pydates(values)
+    assert [str(date) for date in dates] == ["24-01-2000", "10-09-1953"]
+    assert dates.to_pydates() == values
@@ -0,0 +1,42 @@
+from date_operations import Date
+from date_operations.buckets import bucket_of, bucket_bounds, bucket_label, bucket_ids, group_by, UNITS
+import pytest
+
+def test_bucket_of():
+    assert bucket_label(bucket_of("29-02-2000", "month"), "month") == (2000, 2)
+    assert bucket_label(bucket_of(Date("30-09-2000"), "quarter"), "quarter") == (2000, 3)
+    assert bucket_of("31-12-2000", "century") == Date("31-12-2000").century == 20
+    assert bucket_of("01-01-2001", "century") == 21
+    with pytest.raises(ValueError):
+        bucket_of("01-01-2001", "decade")
+
+def test_iso_week():
+    for text in ["01-01-2021", "03-01-2021", "04-01-2021", "31-12-2024", "29-12-2025", "01-01-0001", "31-12-9999"]:
+        date = Date(text)
+        label = bucket_label(bucket_of(date, "iso_week"), "iso_week")
+        assert label == tuple(date.to_pydate().isocalendar())[:2]
+    first, last = bucket_bounds(bucket_of("01-01-2021", "iso_week"), "iso_week")
+    assert (str(first), str(last)) == ("28-12-2020", "03-01-2021")
+    assert first.get_weekday() == "Monday"
+
+def test_bounds():
+    assert [str(date) for date in bucket_bounds(bucket_of("10-02-2000", "month"), "month")] == ["01-02-2000", "29-02-2000"]
+    assert [str(date) for date in bucket_bounds(bucket_of("10-02-1900", "month"), "month")] == ["01-02-1900", "28-02-1900"]
+    assert [str(date) for date in bucket_bounds(bucket_of("10-05-2000", "quarter"), "quarter")] == ["01-04-2000", "30-06-2000"]
+    assert [str(date) for date in bucket_bounds(20, "century")] == ["01-01-1901", "31-12-2000"]
+
+def test_bucket_ids():
+    np = pytest.importorskip("numpy")
+    from date_operations import DateArray
+    rng = np.random.default_rng(0)
+    dates = DateArray.from_ordinals(rng.integers(1, 3652060, 2000))
+    for unit in UNITS:
+        assert bucket_ids(dates, unit).tolist() == [bucket_of(date, unit) for date in dates]
+
+def test_group_by():
+    records = [("31-01-2000", 5), ("01-02-2000", 1), (Date("29-02-2000"), 2), ("15-01-2000", 3)]
+    assert group_by(records, "month") == {2000*12: 2, 2000*12 + 1: 2}
+    assert group_by(records, "month", "sum") == {2000*12: 8, 2000*12 + 1: 3}
+    assert list(group_by(iter(records), "year", "sum").items()) == [(2000, 11)]
+    with pytest.raises(ValueError):
+        group_by(records, "month", "mean")
@@ -0,0 +1,40 @@
+from date_operations.custom_exceptions import InvalidDateAdd, InvalidDateRemove
+
+from date_operations import Date
+from date_operations.business import BusinessCalendar
+import pytest
+
+CALENDAR = BusinessCalendar(holidays=["25-12-2023", "26-12-2023", "01-01-2024", "30-12-2023"])
+
+def test_is_business_day():
+    assert CALENDAR.is_business_day("22-12-2023")
+    assert not CALENDAR.is_business_day("23-12-2023")
+    assert not CALENDAR.is_business_day(Date("25-12-2023"))
+    assert [str(date) for date in CALENDAR.holidays] == ["25-12-2023", "26-12-2023", "01-01-2024"]
+    assert CALENDAR.weekend == (6, 7)
+
+def test_business_days_between():
+    assert CALENDAR.business_days_between("18-12-2023", "08-01-2024") == 12
+    assert CALENDAR.business_days_between("08-01-2024", "18-12-2023") == 12
+    assert BusinessCalendar().business_days_between("01-01-2000", "01-01-2100") == 26089
+    assert BusinessCalendar(weekend=(5,)).business_days_between("01-01-2024", "08-01-2024") == 6
+
+def test_add_remove_business_days():
+    assert str(CALENDAR.add_business_days("22-12-2023", 1)) == "27-12-2023"
+    assert str(CALENDAR.add_business_days("23-12-2023", 0)) == "27-12-2023"
+    assert str(CALENDAR.add_business_days("18-12-2023", 30)) == "01-02-2024"
+    assert str(CALENDAR.remove_business_days("02-01-2024", 3)) == "27-12-2023"
+    assert str(CALENDAR.remove_business_days("24-12-2023", 0)) == "22-12-2023"
+    with pytest.raises(InvalidDateAdd):
+        CALENDAR.add_business_days("29-12-9999", 3)
+    with pytest.raises(InvalidDateRemove):
+        CALENDAR.remove_business_days("02-01-2024", -1)
+
+def test_many():
+    pytest.importorskip("numpy")
+    from date_operations.array import DateArray
+    dates = DateArray(["22-12-2023", "23-12-2023", "18-12-2023"])
+    assert [str(date) for date in CALENDAR.add_business_days_many(dates, [1, 0, 30])] == ["27-12-2023", "27-12-2023", "01-02-2024"]
+    assert [str(date) for date in CALENDAR.remove_business_days_many(dates, 1)] == ["21-12-2023", "21-12-2023", "15-12-2023"]
+    assert CALENDAR.business_days_between_many(dates, "08-01-2024").tolist() == \
+           [CALENDAR.business_days_between(date, "08-01-2024") for date in dates]
@@ -1,6 +1,10 @@
-from date_operations.custom_exceptions import InvalidDateError, InvalidDateFormatError, InvalidDateRemove, InvalidDateAdd
+from date_operations.custom_exceptions import InvalidDateError, InvalidDateFormatError, InvalidDateRemove, InvalidDateAdd, FrozenDateError
 
-from date_operations import Date
+from date_operations import Date, FrozenDate
+from date_operations.date import set_parse_cache_size, parse_cache_info, clear_parse_cache, PARSE_CACHE_SIZE, set_clock, \
+    enable_memoization, disable_memoization, memoization_info, enable_instrumentation, disable_instrumentation, \
+    instrumentation_snapshot, add_instrumentation_sink, remove_instrumentation_sink, fields_of, ordinal_of
+import datetime, pickle, time
 import pytest
 
 def test_data_day():
@@ -82,4 +86,273 @@ def test_error_format():
 
 def test_date_error():
     with pytest.raises(InvalidDateError):
-        date = Date("01-31-2000")
\ No newline at end of file
+        date = Date("01-31-2000")
+
+def test_add_days():
+    date = Date("24-01-2000")
+    date.add_days(100)
+    assert str(date) == "03-05-2000"
+    date.add_days(365*50)
+    assert str(date) == "21-04-2050"
+
+def test_remove_days():
+    date = Date("03-05-2000")
+    date.remove_days(100)
+    assert str(date) == "24-01-2000"
+    date.remove_days(1999*365)
+    assert str(date) == "23-05-0002"
+
+def test_add_months():
+    date = Date("31-01-2000")
+    date.add_months(1)
+    assert str(date) == "29-02-2000"
+    date.add_months(23)
+    assert str(date) == "29-01-2002"
+
+def test_remove_months():
+    date = Date("31-03-2001")
+    date.remove_months(1)
+    assert str(date) == "28-02-2001"
+    date.remove_months(14)
+    assert str(date) == "28-12-1999"
+
+def test_error_add_remove():
+    with pytest.raises(InvalidDateAdd):
+        Date("31-12-9999").add_days(1)
+    with pytest.raises(InvalidDateRemove):
+        Date("01-01-0001").remove_days(1)
+    with pytest.raises(InvalidDateAdd):
+        Date("01-12-9999").add_months(1)
+    with pytest.raises(InvalidDateRemove):
+        Date("01-01-0001").remove_months(1)
+
+def test_error_remove_years():
+    date = Date("01-03-0005")
+    with pytest.raises(InvalidDateRemove):
+        date.remove_years(5)
+    assert str(date) == "01-03-0005" and date.ordinal == Date("01-03-0005").ordinal
+    with pytest.raises(InvalidDateRemove):
+        Date("01-01-0001").minus_years(1)
+    date.remove_years(4)
+    assert str(date) == "01-03-0001"
+
+def test_ordinal():
+    date = Date("01-01-0001")
+    assert date.ordinal == 1
+    date.add_days(730119)
+    assert date.ordinal == 730120
+    assert str(date) == "01-01-2000"
+
+def test_between_long_span():
+    date = Date("31-12-9999")
+    other_date = Date("01-01-0001")
+    assert date.days_between(other_date) == 3652058
+    assert other_date.days_between("31-12-9999") == 3652058
+    assert date.months_between(other_date) == 119987.97
+    assert date.years_between(other_date) == 9999.0
+
+def test_between_same_month():
+    date = Date("24-01-2000")
+    assert date.days_between("10-01-2000") == 14
+    assert date.months_between("10-01-2000") == 0
+    assert date.months_between("24-05-2000") == 4
+    assert date.years_between("24-01-1953") == 47
+
+def test_get_weekday_index():
+    assert Date("24-01-2000").get_weekday_index() == 1
+    assert Date("01-01-0001").get_weekday_index() == 1
+    assert Date("04-07-1776").get_weekday_index() == 4
+    assert Date("31-12-9999").get_weekday() == "Friday"
+    assert Date("15-10-1700").full_date == "Friday 15 October 1700"
+
+def test_hash():
+    date = Date("24-01-2000")
+    other_date = Date("23-01-2000")
+    other_date.add_days(1)
+    assert hash(date) == hash(other_date)
+    assert len({date, other_date, Date("10-09-1953")}) == 2
+    assert {date: "x"}[other_date] == "x"
+    assert date != "24-01-2000"
+
+def test_add_years():
+    date = Date("24-01-2000")
+    assert not hasattr(date, "__dict__")
+    date.add_years(10)
+    assert str(date) == "24-01-2010"
+    date.remove_years(1500)
+    assert str(date) == "24-01-0510"
+    assert date.export_date == {'day': 24, 'month': 1, 'year': 510}
+
+def test_years_leap_day():
+    date = Date("29-02-2000")
+    date.add_years(1)
+    assert str(date) == "28-02-2001" and date == Date("28-02-2001")
+    assert date.export_date == {'day': 28, 'month': 2, 'year': 2001}
+    date.remove_years(5)
+    assert str(date) == "28-02-1996"
+    assert str(Date("29-02-2000").plus_years(4)) == "29-02-2004"
+    frozen = FrozenDate("29-02-2000").minus_years(100)
+    assert type(frozen) == FrozenDate and frozen == Date("28-02-1900") and str(frozen) == "28-02-1900"
+    assert frozen.full_date == "Wednesday 28 February 1900"
+    assert pickle.loads(pickle.dumps(frozen)) == frozen == Date.from_bytes(frozen.to_bytes())
+    assert not frozen < Date("28-02-1900") and frozen.days_between("01-03-1900") == 1
+
+def test_parse_cache():
+    clear_parse_cache()
+    date = Date("24-01-2000")
+    other_date = Date("24-01-2000")
+    assert parse_cache_info().hits == 1 and parse_cache_info().misses == 1
+    assert date is not other_date
+    date.add_days(1)
+    assert str(Date("24-01-2000")) == "24-01-2000"
+    set_parse_cache_size(0)
+    Date("24-01-2000")
+    assert parse_cache_info().hits == 0 and parse_cache_info().currsize == 0
+    set_parse_cache_size(PARSE_CACHE_SIZE)
+
+def test_fields_of():
+    from date_operations.buckets import bucket_of
+    from date_operations.index import DateIndex
+    assert fields_of("24-01-2000") == fields_of(Date("24-01-2000")) == (2000, 1, 24)
+    assert ordinal_of("24-01-2000") == ordinal_of(Date("24-01-2000")) == Date("24-01-2000").ordinal
+    try:
+        set_parse_cache_size(1)
+        bucket_of("24-01-2000", "month")
+        "10-09-1953" in DateIndex(["24-01-2000"])
+        assert parse_cache_info().maxsize == 1 and parse_cache_info().currsize == 1
+        assert parse_cache_info().misses == 2 and parse_cache_info().hits == 1
+    finally:
+        set_parse_cache_size(PARSE_CACHE_SIZE)
+
+def test_date_error_day_zero():
+    with pytest.raises(InvalidDateError):
+        Date("00-02-2000")
+    with pytest.raises(InvalidDateError):
+        Date("01-01-0000")
+    with pytest.raises(InvalidDateError):
+        Date("29-02-1900")
+    with pytest.raises(InvalidDateFormatError):
+        Date("24-01-2000\n")
+
+def test_today():
+    now = [time.mktime((2000, 1, 24, 23, 59, 0, 0, 0, -1))]
+    set_clock(lambda: now[0])
+    try:
+        today = Date.today()
+        assert str(today) == "24-01-2000"
+        today.add_days(1)
+        assert str(Date.today()) == "24-01-2000"
+        now[0] += 120
+        assert str(Date.today()) == "25-01-2000"
+    finally:
+        set_clock()
+    assert type(Date.today()) == Date
+
+def test_plus_minus():
+    date = Date("31-01-2000")
+    assert str(date.plus_days(100)) == "10-05-2000"
+    assert str(date.plus_months(1)) == "29-02-2000"
+    assert str(date.minus_months(2)) == "30-11-1999"
+    assert str(date.plus_years(3)) == "31-01-2003"
+    assert str(date.minus_years(1000)) == "31-01-1000"
+    assert str(date.minus_days(31)) == "31-12-1999"
+    assert str(date) == "31-01-2000"
+    with pytest.raises(InvalidDateAdd):
+        date.plus_days(-1)
+
+def test_frozen_date():
+    date = FrozenDate("24-01-2000")
+    with pytest.raises(FrozenDateError):
+        date.add_days(1)
+    with pytest.raises(FrozenDateError):
+        date.remove_months(1)
+    later = date.plus_days(1)
+    assert type(later) == FrozenDate and str(later) == "25-01-2000" and str(date) == "24-01-2000"
+    assert date.copy() is date
+    assert date == Date("24-01-2000") and hash(date) == hash(Date("24-01-2000"))
+    thawed = date.thaw()
+    thawed.add_days(1)
+    assert thawed == later and type(thawed) == Date
+    assert type(Date("24-01-2000").freeze()) == FrozenDate
+    assert type(FrozenDate.today()) == FrozenDate
+
+def test_memoization():
+    enable_memoization(maxsize=2)
+    try:
+        date = Date("24-01-2000")
+        assert date.full_date == "Monday 24 January 2000"
+        assert date.full_date == "Monday 24 January 2000"
+        assert memoization_info()["full_date"].hits == 1
+        date.add_days(1)
+        assert date.full_date == "Tuesday 25 January 2000"
+        assert date.get_weekday() == "Tuesday"
+        date.export_date["day"] = 1
+        assert date.export_date == {'day': 25, 'month': 1, 'year': 2000}
+        assert date.is_leap and date.century == 20
+        for day in range(1, 10):
+            Date(f"{day:02d}-01-2000").full_date
+        assert memoization_info()["full_date"].currsize == 2
+    finally:
+        disable_memoization()
+    assert memoization_info() == {}
+
+def test_instrumentation():
+    instrumentation_snapshot(reset=True)
+    events, snapshots = [], []
+    sink = add_instrumentation_sink(lambda *event: events.append(event))
+    periodic = add_instrumentation_sink(snapshots.append, every=2)
+    enable_instrumentation()
+    try:
+        date = Date("24-01-2000")
+        date.add_days(400)
+        date.days_between("10-09-1953")
+        assert date.get_weekday() == "Tuesday"
+    finally:
+        disable_instrumentation()
+        remove_instrumentation_sink(sink)
+        remove_instrumentation_sink(periodic)
+    Date("24-01-2000").add_days(1)
+    stats = instrumentation_snapshot(reset=True)
+    assert stats["__init__"]["calls"] == 2 and stats["__validate_date"]["calls"] == 2
+    assert stats["add_days"] == {"calls": 1, "seconds": stats["add_days"]["seconds"], "span": 400, "max_span": 400}
+    assert stats["days_between"]["calls"] == 1 and stats["get_weekday"]["calls"] == 1
+    assert len(events) == 7 and events[2][0] == "add_days"
+    assert len(snapshots) == 3
+    assert instrumentation_snapshot() == {}
+
+def test_instrumentation_failing_sink():
+    instrumentation_snapshot(reset=True)
+    def failing(*event):
+        raise RuntimeError("sink down")
+    sink = add_instrumentation_sink(failing)
+    enable_instrumentation()
+    try:
+        with pytest.warns(RuntimeWarning, match="sink down"):
+            assert str(Date("24-01-2000")) == "24-01-2000"
+        with pytest.warns(RuntimeWarning):
+            with pytest.raises(InvalidDateAdd):
+                Date("31-12-9999").add_days(1)
+    finally:
+        disable_instrumentation()
+        remove_instrumentation_sink(sink)
+    assert instrumentation_snapshot(reset=True)["add_days"]["calls"] == 1
+
+def test_pydate():
+    date = Date.from_pydate(datetime.date(2000, 1, 24))
+    assert str(date) == "24-01-2000" and date.ordinal == Date("24-01-2000").ordinal
+    assert Date("31-12-9999").to_pydate() == datetime.date(9999, 12, 31)
+    assert type(FrozenDate.from_pydate(datetime.datetime(1953, 9, 10, 12, 30))) == FrozenDate
+    assert Date.from_ordinal(1).to_pydate() == datetime.date.min
+
+def test_derived_values_agree():
+    enable_memoization()
+    try:
+        for text in ["29-02-2000", "31-01-2001", "31-12-1999"]:
+            for name, amount in [("add_years", 1), ("remove_years", 3), ("add_months", 1), ("remove_months", 10), ("add_days", 1)]:
+                date = Date(text)
+                getattr(date, name)(amount)
+                assert date.export_date == {'day': date.day, 'month': date.month, 'year': date.year}
+                assert date.full_date.endswith(f"{date.day} {date.to_pydate().strftime('%B')} {date.year}")
+                assert date == Date(str(date)) and date.ordinal == Date(str(date)).ordinal
+    finally:
+        disable_memoization()
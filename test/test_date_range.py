@@ -0,0 +1,64 @@
+from date_operations.custom_exceptions import InvalidDateFormatError
+
+from date_operations import Date
+from date_operations.date_range import DateRange
+import pytest
+
+def test_days():
+    dates = DateRange("28-02-2000", "03-03-2000")
+    assert len(dates) == 4
+    assert [str(date) for date in dates] == ["28-02-2000", "29-02-2000", "01-03-2000", "02-03-2000"]
+    assert [str(date) for date in reversed(dates)] == ["02-03-2000", "01-03-2000", "29-02-2000", "28-02-2000"]
+    assert str(dates[-1]) == "02-03-2000"
+    assert "29-02-2000" in dates and "03-03-2000" not in dates
+    assert len(DateRange("03-03-2000", "28-02-2000")) == 0
+
+def test_weeks_backwards():
+    dates = DateRange("24-01-2000", "01-01-2000", step=-1, unit="weeks")
+    assert [str(date) for date in dates] == ["24-01-2000", "17-01-2000", "10-01-2000", "03-01-2000"]
+    assert all(date.get_weekday() == "Monday" for date in dates)
+    assert dates.index("10-01-2000") == 2
+    assert dates.count(Date("11-01-2000")) == 0
+
+def test_months():
+    dates = DateRange("31-01-2000", "31-05-2000", unit="months")
+    assert [str(date) for date in dates] == ["31-01-2000", "29-02-2000", "31-03-2000", "30-04-2000"]
+    assert "30-04-2000" in dates and "29-04-2000" not in dates
+    expected = Date("31-01-2000")
+    expected.add_months(2)
+    assert dates[2] == expected
+    assert len(DateRange("31-01-2000", "30-04-2000", unit="months")) == 3
+
+def test_slice():
+    dates = DateRange("01-01-0001", "01-01-9999", step=3)
+    assert len(dates) == 1217232
+    part = dates[10:1000000:1000]
+    assert len(part) == 1000
+    assert part[1] == dates[1010]
+    assert dates[1010] in part and dates[1011] not in part
+    assert part.step == 3000
+    months = DateRange("31-01-2000", "01-01-2010", unit="months")[1::12]
+    assert [str(date) for date in months][:3] == ["29-02-2000", "28-02-2001", "28-02-2002"]
+
+def test_ordinals():
+    dates = DateRange("31-01-2000", "31-01-2001", step=2, unit="months")
+    assert list(dates.ordinals()) == [date.ordinal for date in dates]
+
+def test_to_array():
+    pytest.importorskip("numpy")
+    dates = DateRange("31-01-2000", "31-01-2003", step=5, unit="months")
+    assert [str(date) for date in dates.to_array()] == [str(date) for date in dates]
+    dates = DateRange("01-01-2000", "01-01-2001", step=10)[::-1]
+    assert dates.to_array().ordinals.tolist() == list(dates.ordinals())
+
+def test_invalid():
+    with pytest.raises(ValueError):
+        DateRange("01-01-2000", "01-01-2001", step=0)
+    with pytest.raises(ValueError):
+        DateRange("01-01-2000", "01-01-2001", unit="years")
+
+def test_contains_invalid():
+    dates = DateRange("24-01-2000", "24-02-2000")
+    assert "2000-01-24" not in dates and "30-02-2000" not in dates and 5 not in dates
+    with pytest.raises(InvalidDateFormatError):
+        dates.index("2000-01-24")
@@ -0,0 +1,70 @@
+from date_operations.custom_exceptions import InvalidDateError, InvalidDateFormatError
+
+from date_operations import Date
+from date_operations.formats import compile_format, parse_many
+import pytest
+
+def test_parse():
+    assert str(Date.parse("2000-01-24", "iso")) == "24-01-2000"
+    assert str(Date.parse("24/01/2000", "%d/%m/%Y")) == "24-01-2000"
+    assert str(Date.parse("01/24/2000", "us")) == "24-01-2000"
+    assert str(Date.parse("3 February 2001", "long")) == "03-02-2001"
+    assert str(Date.parse("3 feb 2001", "%-d %b %Y")) == "03-02-2001"
+    assert str(Date.parse("Monday 24 January 2000", "full")) == "24-01-2000"
+    assert str(Date.parse("24-01-2000 100%", "%d-%m-%Y 100%%")) == "24-01-2000"
+
+def test_parse_errors():
+    with pytest.raises(InvalidDateError):
+        Date.parse("0000-01-01", "iso")
+    with pytest.raises(InvalidDateError):
+        Date.parse("1 January 0000", "long")
+    with pytest.raises(InvalidDateFormatError):
+        Date.parse("24-01-2000", "iso")
+    with pytest.raises(InvalidDateFormatError):
+        Date.parse("24 Janvier 2000", "long")
+    with pytest.raises(InvalidDateError):
+        Date.parse("2001-02-29", "iso")
+    with pytest.raises(InvalidDateError):
+        Date.parse("Tuesday 24 January 2000", "full")
+    with pytest.raises(ValueError):
+        Date.parse("2000", "%Y")
+    with pytest.raises(ValueError):
+        compile_format("%Y-%q")
+
+def test_format():
+    date = Date("03-02-0999")
+    assert date.format("iso") == "0999-02-03"
+    assert date.format("%d/%m/%Y") == "03/02/0999"
+    assert date.format("%b %-d, %Y") == "Feb 3, 0999"
+    assert Date("24-01-2000").format("full") == Date("24-01-2000").full_date
+    assert compile_format("iso") is compile_format("iso")
+
+def test_parse_many():
+    pytest.importorskip("numpy")
+    strings = ["2000-01-24", "1953-09-10", "2000-02-29"]
+    assert [str(date) for date in parse_many(strings, "iso")] == ["24-01-2000", "10-09-1953", "29-02-2000"]
+    assert [str(date) for date in parse_many(["24 January 2000"], "long")] == ["24-01-2000"]
+    with pytest.raises(InvalidDateFormatError):
+        parse_many(["2000-01-24", "24-01-2000"], "iso")
+    with pytest.raises(InvalidDateError):
+        parse_many(["2000-01-24", "1900-02-29"], "iso")
+
+def test_parse_many_split():
+    np = pytest.importorskip("numpy")
+    assert compile_format("full").split == ("", ("%A", "%-d", "%B", "%Y"), (" ", " ", " "), "")
+    assert compile_format("%-d%B %Y").split is None
+    rng = np.random.default_rng(2)
+    dates = [Date.from_ordinal(int(ordinal)) for ordinal in rng.integers(1, 3652060, 500)]
+    for fmt in ["long", "full", "%b %-d, %Y", "[%-m/%-d/%Y]", "%Y.%-m.%-d"]:
+        strings = [date.format(fmt) for date in dates]
+        assert parse_many(strings, fmt).tolist() == dates
+    assert parse_many(["monday 24 JANUARY 2000"], "full").tolist() == [Date("24-01-2000")]
+    assert parse_many(["٢٤ January 2000"], "long").tolist() == [Date("24-01-2000")]
+    with pytest.raises(InvalidDateFormatError):
+        parse_many(["24 January 2000", "24  January 2000"], "long")
+    with pytest.raises(InvalidDateFormatError):
+        parse_many(["24 Jan 2000"], "long")
+    with pytest.raises(InvalidDateError):
+        parse_many(["Tuesday 24 January 2000"], "full")
+    with pytest.raises(InvalidDateError):
+        parse_many(["29 February 1900"], "long")
@@ -0,0 +1,46 @@
+from date_operations import Date
+from date_operations import index as index_module
+from date_operations.index import DateIndex
+
+DATES = ["24-01-2000", "10-09-1953", "29-02-2000", "01-01-2000", "24-01-2000"]
+
+def test_build():
+    index = DateIndex(DATES, values=range(5))
+    assert len(index) == 5
+    assert [(str(date), value) for date, value in index] == \
+           [("10-09-1953", 1), ("01-01-2000", 3), ("24-01-2000", 0), ("24-01-2000", 4), ("29-02-2000", 2)]
+    assert "29-02-2000" in index and Date("28-02-2000") not in index
+    assert "2000-02-29" not in index and "30-02-2000" not in index and 730179 not in index
+
+def test_between():
+    index = DateIndex(DATES, values=range(5))
+    assert [value for _, value in index.between("01-01-2000", "24-01-2000")] == [3, 0, 4]
+    assert index.count_between("01-01-2000", "24-01-2000") == 3
+    assert index.count_between("24-01-2000", "01-01-2000") == 0
+    assert index.between("01-01-2001", "01-01-2002") == []
+
+def test_nearest():
+    index = DateIndex(DATES, values=range(5))
+    assert index.floor("28-02-2000")[1] == 4
+    assert index.ceil("28-02-2000")[1] == 2
+    assert str(index.nearest("01-01-1970")[0]) == "10-09-1953"
+    assert index.floor("01-01-1900") is None
+    assert index.ceil("01-01-2001") is None
+    assert DateIndex().nearest("01-01-2000") is None
+
+def test_add(monkeypatch):
+    monkeypatch.setattr(index_module, "MIN_BUFFER", 2)
+    index = DateIndex(DATES[:2], values=["a", "b"])
+    for number, date in enumerate(["15-05-1999", "01-01-1953", "02-03-2000", "24-01-2000"]):
+        index.add(date, number)
+    assert len(index) == 6
+    assert [value for _, value in index] == [1, "b", 0, "a", 3, 2]
+    assert index.floor("01-03-2000")[1] == 3 and index.ceil("01-03-2000")[1] == 2
+    assert index.count_between("01-01-1953", "24-01-2000") == 5
+    assert list(index.ordinals()) == sorted(Date(date).ordinal for date in
+                                            DATES[:2] + ["15-05-1999", "01-01-1953", "02-03-2000", "24-01-2000"])
+
+def test_sorted_dates():
+    dates = [Date(date) for date in DATES]
+    assert [str(date) for date in sorted(dates)] == ["10-09-1953", "01-01-2000", "24-01-2000", "24-01-2000", "29-02-2000"]
+    assert Date("24-01-2000") <= Date("24-01-2000") < Date("29-02-2000")
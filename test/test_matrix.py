@@ -0,0 +1,34 @@
+import pytest
+np = pytest.importorskip("numpy")
+from date_operations import Date, DateArray
+from date_operations.matrix import difference_matrix, iter_difference_blocks, UNITS
+
+METHODS = {"seconds": "second_between", "minutes": "minutes_between", "hours": "hours_between", "days": "days_between",
+           "weeks": "week_between", "months": "months_between", "years": "years_between"}
+
+def test_matches_scalar():
+    rng = np.random.default_rng(1)
+    dates = DateArray.from_ordinals(rng.integers(693596, 767011, 40))
+    others = list(DateArray.from_ordinals(rng.integers(693596, 767011, 30))) + [Date("29-02-2000"), "24-01-2000"]
+    scalar_others = [other if isinstance(other, Date) else Date(other) for other in others]
+    for unit in UNITS:
+        matrix = difference_matrix(dates, others, unit)
+        assert matrix.shape == (40, 32)
+        assert matrix.tolist() == [[getattr(date, METHODS[unit])(other) for other in scalar_others] for date in dates]
+
+def test_blocks():
+    dates = DateArray(["24-01-2000", "29-02-2000", "31-12-2000", "01-01-0001", "31-12-9999"])
+    blocks = list(iter_difference_blocks(dates, dates, "months", block_rows=2, block_columns=3))
+    assert [(row, column, block.shape) for row, column, block in blocks] == \
+        [(0, 0, (2, 3)), (0, 3, (2, 2)), (2, 0, (2, 3)), (2, 3, (2, 2)), (4, 0, (1, 3)), (4, 3, (1, 2))]
+    matrix = difference_matrix(dates, dates, "months")
+    for row, column, block in blocks:
+        assert (matrix[row:row + block.shape[0], column:column + block.shape[1]] == block).all()
+    assert (np.diag(matrix) == 0).all() and (matrix == matrix.T).all()
+
+def test_invalid():
+    with pytest.raises(ValueError):
+        difference_matrix(["24-01-2000"], ["24-01-2000"], "decades")
+    with pytest.raises(ValueError):
+        next(iter_difference_blocks(["24-01-2000"], ["24-01-2000"], block_rows=0))
+    assert difference_matrix([], ["24-01-2000"], "years").shape == (0, 1)
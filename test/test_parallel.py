@@ -0,0 +1,38 @@
+from date_operations import Date
+from date_operations.parallel import between_many, days_between_many, years_between_many
+import pytest
+
+PAIRS = [("24-01-2000", "10-09-1953"), ("29-02-2000", "28-02-2001"), ("31-12-9999", "01-01-0001"),
+         ("01-03-1700", "24-01-2000"), ("15-06-2010", "15-06-2010")] * 3
+
+@pytest.mark.parametrize("unit", ["days", "months", "years"])
+def test_between_many_serial(unit):
+    expected = [getattr(Date(a), unit + "_between")(Date(b)) for a, b in PAIRS]
+    assert between_many(PAIRS, unit) == expected
+    assert between_many([(Date(a), b) for a, b in PAIRS], unit, workers=1, chunk_size=4) == expected
+
+def test_between_many_pool():
+    expected = [Date(a).days_between(b) for a, b in PAIRS]
+    assert days_between_many(PAIRS, workers=2, chunk_size=4, min_parallel=0) == expected
+    unordered = years_between_many(PAIRS, workers=2, chunk_size=4, ordered=False, min_parallel=0)
+    assert sorted(unordered) == [(index, Date(a).years_between(b)) for index, (a, b) in enumerate(PAIRS)]
+
+def test_between_many_empty():
+    assert between_many([], "days") == []
+    with pytest.raises(ValueError):
+        between_many(PAIRS, "weeks")
+
+def test_between_many_invalid():
+    from date_operations.custom_exceptions import InvalidDateError, InvalidDateFormatError
+    with pytest.raises(InvalidDateError, match="'29-02-1900'"):
+        days_between_many(PAIRS + [("29-02-1900", "24-01-2000")], workers=2, chunk_size=4, min_parallel=0)
+    with pytest.raises(InvalidDateFormatError, match="^Invalid date format: '2000-01-24'"):
+        days_between_many([("24-01-2000", "2000-01-24")], workers=1)
+
+def test_between_many_types():
+    with pytest.raises(TypeError):
+        between_many([(5, "01-01-2000")])
+    with pytest.raises(TypeError):
+        between_many([(0, 1)], "months", workers=2, min_parallel=0)
+    pairs = [(Date("24-01-2000"), Date("10-09-1953")), (Date("24-01-2000"), "10-09-1953"), ("24-01-2000", "10-09-1953")]
+    assert days_between_many(pairs * 3, workers=2, chunk_size=2, min_parallel=0) == [16937] * 9
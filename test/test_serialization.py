@@ -0,0 +1,40 @@
+from date_operations import Date, FrozenDate
+from date_operations.date import MIN_ORDINAL, MAX_ORDINAL
+from date_operations.serialization import dumps_many, loads_many, iter_loads, loads_array
+import pickle
+import pytest
+
+def test_to_bytes():
+    date = Date("24-01-2000")
+    assert len(date.to_bytes()) == 4
+    assert Date.from_bytes(date.to_bytes()) == date
+    assert Date.from_ordinal(MAX_ORDINAL) == Date("31-12-9999")
+    with pytest.raises(ValueError):
+        Date.from_ordinal(MAX_ORDINAL + 1)
+    with pytest.raises(ValueError):
+        Date.from_bytes(b"\0\0\0\0")
+
+def test_pickle():
+    date = Date("24-01-2000")
+    assert pickle.loads(pickle.dumps(date)) == date
+    frozen = pickle.loads(pickle.dumps(FrozenDate("29-02-2000")))
+    assert type(frozen) == FrozenDate and str(frozen) == "29-02-2000"
+    assert b"_Date__" not in pickle.dumps(date)
+
+def test_many():
+    dates = [Date.from_ordinal(ordinal) for ordinal in range(MIN_ORDINAL, MAX_ORDINAL + 1, 97)] + [Date("31-12-9999")]
+    data = dumps_many(dates)
+    assert len(data) == 4*len(dates)
+    assert loads_many(data) == dates
+    assert list(iter_loads(memoryview(bytearray(data))[4:12])) == dates[1:3]
+    assert dumps_many(["24-01-2000"]) == Date("24-01-2000").to_bytes()
+    with pytest.raises(ValueError):
+        loads_many(data[:-1])
+
+def test_loads_array():
+    pytest.importorskip("numpy")
+    from date_operations.array import DateArray
+    dates = DateArray.from_ordinals(range(MIN_ORDINAL, MAX_ORDINAL + 1))
+    data = dumps_many(dates)
+    assert len(data) == 4*MAX_ORDINAL
+    assert (loads_array(data) == dates).all()
@@ -0,0 +1,52 @@
+from date_operations import Date
+from date_operations.custom_exceptions import InvalidDateAdd, InvalidDateError, InvalidDateFormatError
+from date_operations.service import DateService
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import pytest
+
+def test_batch():
+    async def main():
+        async with DateService(window=0.01) as service:
+            results = await asyncio.gather(service.days_between("24-01-2000", "10-09-1953"),
+                                           service.days_between(Date("24-01-2000"), "10-09-1953"),
+                                           service.full_date("24-01-2000"),
+                                           service.add_days("31-12-1999", 366))
+            return results, service.metrics()
+    results, metrics = asyncio.run(main())
+    assert results[:3] == [16937, 16937, "Monday 24 January 2000"]
+    assert str(results[3]) == "31-12-2000"
+    assert metrics["requests"] == 4 and metrics["coalesced"] == 1
+    assert metrics["batches"] == 1 and metrics["last_batch_size"] == 3
+    assert metrics["queue_depth"] == 0 and metrics["in_flight"] == 0
+
+def test_coalescing():
+    async def main():
+        service = DateService(window=0.01, executor=ThreadPoolExecutor(1))
+        requests = [service.add_days("24-01-2000", 7) for _ in range(50)] + [service.full_date("24-01-2000") for _ in range(50)]
+        tasks = [asyncio.ensure_future(request) for request in requests]
+        await asyncio.sleep(0)
+        depth = service.queue_depth
+        results = await asyncio.gather(*tasks)
+        await service.close()
+        return depth, results, service.metrics()
+    depth, results, metrics = asyncio.run(main())
+    assert depth == 2
+    assert all(str(date) == "31-01-2000" for date in results[:50]) and results[0] is not results[1]
+    assert metrics["requests"] == 100 and metrics["coalesced"] == 98 and metrics["operations"] == 2
+
+def test_max_batch_and_errors():
+    async def main():
+        service = DateService(window=10, max_batch=4)
+        results = await asyncio.gather(service.days_between("01-01-2000", "01-01-2001"),
+                                       service.add_days("24-01-2000", -1),
+                                       service.full_date("2000-01-24"),
+                                       service.days_between("31-02-2000", "2000-01-24"), return_exceptions=True)
+        return results, service.metrics()
+    results, metrics = asyncio.run(main())
+    assert results[0] == 366
+    assert isinstance(results[1], InvalidDateAdd) and isinstance(results[2], InvalidDateFormatError)
+    assert isinstance(results[3], InvalidDateError)
+    assert metrics["batches"] == 1 and metrics["max_batch_size"] == 4
+    with pytest.raises(ValueError):
+        DateService(max_batch=0)
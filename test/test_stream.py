@@ -0,0 +1,38 @@
+from date_operations.custom_exceptions import InvalidDateError, InvalidDateFormatError
+
+from date_operations import Date
+from date_operations.stream import validate_lines, validate_file, main
+import io
+import pytest
+
+LINES = ["24-01-2000\n", "2000-01-24\n", "31-02-2000\r\n", "10-09-1953"]
+
+def test_validate_lines():
+    rows = list(validate_lines(LINES))
+    assert [row.line for row in rows] == [1, 2, 3, 4]
+    assert [row.value for row in rows] == ["24-01-2000", None, None, "10-09-1953"]
+    assert [row.error for row in rows] == [None, InvalidDateFormatError, InvalidDateError, None]
+
+def test_validate_lines_ordinal():
+    rows = list(validate_lines(LINES, output="ordinal", errors_only=True))
+    assert [(row.line, row.text) for row in rows] == [(2, "2000-01-24"), (3, "31-02-2000")]
+    assert next(validate_lines(LINES, output="ordinal")).value == Date("24-01-2000").ordinal
+
+def test_validate_lines_whitespace():
+    rows = list(validate_lines(["  24-01-2000\t\n", "24-01-2000 \r\n"]))
+    assert [(row.text, row.error) for row in rows] == [("  24-01-2000\t", InvalidDateFormatError), ("24-01-2000 ", InvalidDateFormatError)]
+    with pytest.raises(InvalidDateFormatError):
+        Date(" 24-01-2000")
+
+def test_validate_file():
+    file = io.BytesIO("".join(LINES).encode())
+    rows = list(validate_file(file, chunk_size=7))
+    assert [row.value for row in rows] == ["24-01-2000", None, None, "10-09-1953"]
+
+def test_main(tmp_path, capsys):
+    path = tmp_path / "dates.txt"
+    path.write_text("".join(LINES))
+    assert main([str(path), "--output", "ordinal"]) == 1
+    out, err = capsys.readouterr()
+    assert out.split() == [str(Date("24-01-2000").ordinal), str(Date("10-09-1953").ordinal)]
+    assert err.splitlines() == ["line 2: InvalidDateFormatError: '2000-01-24'", "line 3: InvalidDateError: '31-02-2000'"]